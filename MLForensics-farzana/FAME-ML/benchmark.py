@@ -0,0 +1,240 @@
+'''
+Throughput benchmark for the FAME-ML pipeline
+Generates synthetic ML repos whose API calls come from the detector rule tables, then times parsing, fact
+extraction, every detector and main.getCSVData() end to end ... results go to a JSON file so that runs from
+different commits can be compared with --compare
+'''
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import constants
+import event_sink
+import lint_engine
+import main
+import py_parser
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows, peak RSS is then reported as None
+    resource = None
+
+
+def getAPITemplates():
+    '''
+    one source line per detector rule, with as many arguments as the rule needs
+    '''
+    template_list = []
+    for rule_dict in ( constants.DATA_LOAD_ATTRIB_RULES, constants.MODEL_LOAD_ATTRIB_RULES, constants.DATA_DOWNLOAD_ATTRIB_RULES,
+                       constants.MODEL_OUTPUT_ATTRIB_RULES, constants.DATA_PIPELINE_ATTRIB_RULES, constants.ENVIRONMENT_ATTRIB_RULES,
+                       constants.STATE_OBSERVE_ATTRIB_RULES ):
+        for ( class_name, func_name ), min_arg_count in sorted( rule_dict.items() ):
+            template_list.append( ( '{} = ' + class_name + '.' + func_name + '({})', max( min_arg_count, 1 ) ) )
+    for rule_dict in ( constants.DATA_LOAD_ASSIGN_RULES, constants.MODEL_LOAD_ASSIGN_RULES, constants.MODEL_OUTPUT_ASSIGN_RULES,
+                       constants.DATA_PIPELINE_ASSIGN_RULES ):
+        for func_name, min_arg_count in sorted( rule_dict.items() ):
+            template_list.append( ( '{} = ' + func_name + '({})', max( min_arg_count, 1 ) ) )
+    for rule_dict in ( constants.DATA_LOAD_CALL_RULES, constants.MODEL_LOAD_CALL_RULES, constants.DATA_DOWNLOAD_CALL_RULES,
+                       constants.DATA_PIPELINE_CALL_RULES ):
+        for func_name, min_arg_count in sorted( rule_dict.items() ):
+            template_list.append( ( func_name + '({1})', max( min_arg_count, 1 ) ) )
+    return template_list
+
+
+def getSyntheticSource( rand_, template_list, file_lines, api_density ):
+    line_list = [ constants.BENCH_FILE_HEADER ]
+    for line_no in range( file_lines ):
+        var_name = constants.BENCH_VAR_NAME.format( line_no )
+        if rand_.random() < api_density:
+            template_, arg_count = rand_.choice( template_list )
+            arg_list = [ constants.BENCH_ARG_NAME.format( rand_.randrange( file_lines ) ) for _ in range( arg_count ) ]
+            line_list.append( template_.format( var_name, ', '.join( arg_list ) ) )
+            # half of the API calls get their first argument logged, for lint_engine.getLoggedEvents()
+            if rand_.random() < 0.5:
+                line_list.append( constants.BENCH_LOG_LINE.format( arg_list[0] ) )
+        else:
+            line_list.append( constants.BENCH_FILLER_LINE.format( var_name, constants.BENCH_ARG_NAME.format( line_no ), line_no ) )
+    return constants.NEWLINE_KW.join( line_list ) + constants.NEWLINE_KW
+
+
+def generateSyntheticRepos( out_dir, repo_count=constants.BENCH_REPO_COUNT, file_count=constants.BENCH_FILE_COUNT,
+                            file_lines=constants.BENCH_FILE_LINES, api_density=constants.BENCH_API_DENSITY, seed=constants.BENCH_SEED ):
+    '''
+    writes repo_count repos of file_count files each under out_dir, the same seed always gives the same repos
+    '''
+    rand_ = random.Random( seed )
+    template_list = getAPITemplates()
+    repo_list = []
+    for repo_no in range( repo_count ):
+        dir_repo = os.path.join( out_dir, constants.BENCH_REPO_NAME.format( repo_no ) )
+        os.makedirs( dir_repo, exist_ok=True )
+        for file_no in range( file_count ):
+            with open( os.path.join( dir_repo, constants.BENCH_FILE_NAME.format( file_no ) ), 'w', encoding=constants.UTF_ENCODING ) as file_:
+                file_.write( getSyntheticSource( rand_, template_list, file_lines, api_density ) )
+        repo_list.append( dir_repo )
+    return repo_list
+
+
+def getPeakRSS():
+    '''
+    peak resident set size of this process in KB so far, ru_maxrss is in bytes on macOS
+    '''
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage( resource.RUSAGE_SELF ).ru_maxrss
+    if sys.platform == 'darwin':
+        peak_rss = peak_rss // 1024
+    return peak_rss
+
+
+def getCommitHash():
+    try:
+        return subprocess.check_output( constants.BENCH_COMMIT_CMD, cwd=os.path.dirname( os.path.abspath( __file__ ) ),
+                                        stderr=subprocess.DEVNULL ).decode().strip()
+    except ( OSError, subprocess.CalledProcessError ):
+        return None
+
+
+def timeBestOf( repeat_count, bench_func ):
+    '''
+    best wall time of repeat_count runs, the least noisy estimate on a shared machine
+    '''
+    best_time = None
+    for _ in range( repeat_count ):
+        start_time = time.perf_counter()
+        bench_func()
+        run_time = time.perf_counter() - start_time
+        if ( best_time is None ) or ( run_time < best_time ):
+            best_time = run_time
+    return best_time
+
+
+def getRate( item_count, run_time ):
+    if run_time <= 0:
+        return None
+    return round( item_count / run_time, 2 )
+
+
+def runBenchmark( repo_list, repeat_count=constants.BENCH_REPEAT ):
+    py_file_list = []
+    total_bytes  = 0
+    for dir_repo in repo_list:
+        for py_file in sorted( main.getAllPythonFilesinRepo( dir_repo, check_parsable=False ) ):
+            py_file_list.append( py_file )
+            total_bytes += os.path.getsize( py_file )
+    file_count = len( py_file_list )
+    results_ = { 'files': file_count, 'bytes': total_bytes, 'peak_rss_kb': {} }
+
+    def parseAll():
+        py_parser.clearParseCache()
+        for py_file in py_file_list:
+            py_parser.getParseTreeIfParsable( py_file )
+    parse_time = timeBestOf( repeat_count, parseAll )
+    results_['parse'] = { 'seconds': round( parse_time, 4 ), 'parses_per_sec': getRate( file_count, parse_time ) }
+    results_['peak_rss_kb']['parse'] = getPeakRSS()
+
+    tree_list  = [ py_parser.getParseTreeIfParsable( py_file ) for py_file in py_file_list ]
+    py_parser.clearParseCache()
+    facts_time = timeBestOf( repeat_count, lambda: [ py_parser.getFileFacts( py_tree ) for py_tree in tree_list ] )
+    results_['facts'] = { 'seconds': round( facts_time, 4 ), 'files_per_sec': getRate( file_count, facts_time ) }
+    facts_list = [ py_parser.getFileFacts( py_tree ) for py_tree in tree_list ]
+    del tree_list
+    results_['peak_rss_kb']['facts'] = getPeakRSS()
+
+    event_sink.openEventSink( constants.SINK_SILENT )
+    try:
+        detector_dict = {}
+        for detector_name in constants.BENCH_DETECTORS:
+            detector_ = getattr( lint_engine, detector_name )
+            def detectAll():
+                for py_file, file_facts in zip( py_file_list, facts_list ):
+                    detector_( py_file, file_facts )
+                event_sink.drainEvents()
+            detector_dict[detector_name] = round( timeBestOf( repeat_count, detectAll ), 6 )
+        results_['detectors'] = detector_dict
+        del facts_list
+
+        def analyzeAll():
+            py_parser.clearParseCache()
+            for dir_repo in repo_list:
+                main.getCSVData( main.getAllPythonFilesinRepo( dir_repo ), dir_repo )
+                event_sink.flushEvents()
+        pipeline_time = timeBestOf( repeat_count, analyzeAll )
+    finally:
+        event_sink.closeEventSink()
+    results_['pipeline'] = { 'seconds': round( pipeline_time, 4 ), 'files_per_sec': getRate( file_count, pipeline_time ) }
+    results_['peak_rss_kb']['pipeline'] = getPeakRSS()
+    return results_
+
+
+def printResults( results_ ):
+    print( constants.BENCH_SUMMARY_STR.format( 'files', results_['files'] ) )
+    print( constants.BENCH_SUMMARY_STR.format( 'parses/sec', results_['parse']['parses_per_sec'] ) )
+    print( constants.BENCH_SUMMARY_STR.format( 'facts files/sec', results_['facts']['files_per_sec'] ) )
+    print( constants.BENCH_SUMMARY_STR.format( 'pipeline files/sec', results_['pipeline']['files_per_sec'] ) )
+    print( constants.BENCH_SUMMARY_STR.format( 'peak RSS KB', results_['peak_rss_kb']['pipeline'] ) )
+    for detector_name, detector_time in results_['detectors'].items():
+        print( constants.BENCH_SUMMARY_STR.format( detector_name, detector_time ) )
+
+
+def getComparableMetrics( results_ ):
+    metric_dict = {
+        'parses/sec'        : results_['parse']['parses_per_sec'],
+        'facts files/sec'   : results_['facts']['files_per_sec'],
+        'pipeline files/sec': results_['pipeline']['files_per_sec'],
+    }
+    for detector_name, detector_time in results_['detectors'].items():
+        metric_dict[detector_name] = detector_time
+    return metric_dict
+
+
+def compareResults( old_results, new_results ):
+    '''
+    prints old value, new value and new/old for every metric ... rates should go up, detector seconds down
+    '''
+    old_metrics = getComparableMetrics( old_results )
+    new_metrics = getComparableMetrics( new_results )
+    for metric_name, new_value in new_metrics.items():
+        old_value = old_metrics.get( metric_name )
+        ratio_ = None
+        if old_value and new_value:
+            ratio_ = round( new_value / old_value, 2 )
+        print( constants.BENCH_COMPARE_STR.format( metric_name, str( old_value ), str( new_value ), str( ratio_ ) ) )
+
+
+if __name__=='__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--repos', type=int, default=constants.BENCH_REPO_COUNT, help='number of synthetic repos')
+    arg_parser.add_argument('--files', type=int, default=constants.BENCH_FILE_COUNT, help='python files per repo')
+    arg_parser.add_argument('--lines', type=int, default=constants.BENCH_FILE_LINES, help='lines per file')
+    arg_parser.add_argument('--density', type=float, default=constants.BENCH_API_DENSITY, help='share of lines that are ML API calls')
+    arg_parser.add_argument('--repeat', type=int, default=constants.BENCH_REPEAT, help='runs per measurement, the best one is kept')
+    arg_parser.add_argument('--seed', type=int, default=constants.BENCH_SEED, help='seed of the synthetic repo generator')
+    arg_parser.add_argument('--output', default=constants.BENCH_OUTPUT_FILE, help='JSON file the results are written to')
+    arg_parser.add_argument('--compare', default=None, help='JSON results of an earlier run to compare against')
+    cli_args = arg_parser.parse_args()
+
+    bench_dir = tempfile.mkdtemp()
+    try:
+        repo_list = generateSyntheticRepos( bench_dir, cli_args.repos, cli_args.files, cli_args.lines, cli_args.density, cli_args.seed )
+        results_  = runBenchmark( repo_list, cli_args.repeat )
+    finally:
+        shutil.rmtree( bench_dir, ignore_errors=True )
+    results_['settings'] = { 'repos': cli_args.repos, 'files': cli_args.files, 'lines': cli_args.lines, 'density': cli_args.density,
+                             'repeat': cli_args.repeat, 'seed': cli_args.seed }
+    results_['commit']   = getCommitHash()
+    results_['python']   = platform.python_version()
+    with open( cli_args.output, 'w', encoding=constants.UTF_ENCODING ) as out_file:
+        json.dump( results_, out_file, indent=2 )
+    printResults( results_ )
+    if cli_args.compare is not None:
+        with open( cli_args.compare, 'r', encoding=constants.UTF_ENCODING ) as old_file:
+            compareResults( json.load( old_file ), results_ )
@@ -221,6 +221,246 @@ INFO_KW = 'info'
 TF_KW = 'tf'
 
 
+# detector rules: attribute calls are keyed by ( receiver, method ) and plain calls by the bare function name, 
+# each mapped to the fewest call arguments the rule needs, so a call site is matched with one dict lookup 
+# commented out rules are skipped as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md 
+DATA_LOAD_ATTRIB_RULES = {
+    ( TORCH_KW, LOAD_KW ): 0, 
+    ( DATA_KW, LOAD_KW ): 0, 
+    ( PICKLE_KW, LOAD_KW ): 0, 
+    ( JSON_KW, LOAD_KW ): 0, 
+    ( NP_KW, LOAD_KW ): 0, 
+    ( LATEST_BLOB_KW, DOWNLOAD_TO_FILENAME_KW ): 0, 
+    ( BLOB_KW, UPLOAD_FROM_FILENAME_KW ): 0, 
+    # ( VISDOM_LOGGER_KW, LOAD_PREVIOUS_VALUES_KW ): 0, 
+    ( COCO_GT_KW, LOADRES_KW ): 0, 
+    ( YAML_KW, LOAD_KW ): 0, 
+    ( HUB_KW, LOAD_KW ): 0, 
+    ( DATA_LOADER_FACTORY_KW, GET_DATA_LOADER_KW ): 0, 
+    ( IO_KW, READ_FILE_KW ): 0, 
+    ( DATASET_KW, TENSOR_SLICE_KW ): 0, 
+    ( SP_MODEL_KW, LOAD_CAPITAL_KW ): 0, 
+    ( TAGGING_DATA_LOADER_KW, LOAD_KW ): 0, 
+    ( PD_KW, READ_CSV_KW ): 0, 
+    # ( FILES_KW, LOAD_FILES_LIST_KW ): 0, 
+    ( IBROSA_KW, LOAD_KW ): 0, 
+    ( DATA_UTILS_KW, LOAD_CELEBA_KW ): 0, 
+    ( DSET_KW, MNIST_KW ): 0, 
+    ( TARFILE_KW, OPEN_KW ): 0, 
+    ( AUDIO_KW, LOAD_WAV_KW ): 0, 
+    ( IMAGE_KW, OPEN_KW ): 0, 
+    ( REPLAY_BUFFER_KW, LOAD_KW ): 0, 
+    ( H5PY_KW, FILE_KW ): 0, 
+}
+DATA_LOAD_ASSIGN_RULES = { GET_LOADER_KW: 1, FROM_BUFFER_KW: 1 }
+DATA_LOAD_CALL_RULES = {
+    LOAD_RANDOMLY_AUGMENTED_AUDIO_KW: 1, 
+    _DOWNLOAD_KW: 1, 
+    OPEN_KW: 1, 
+    LOAD_KW: 1, 
+    LOAD_GENERIC_AUDIO_KW: 1, 
+    LOAD_AUDIO_KW: 1, 
+    LOAD_IMAGE_DATASET_KW: 1, 
+    DOWNLOAD_FROM_URL_KW: 1, 
+    GET_RAW_FILES_KW: 1, 
+    LOAD_VOCAB_FILE_KW: 1, 
+    LOAD_ATTRIBUTE_DATASET_KW: 1, 
+    READ_H5FILE_KW: 1, 
+    LOAD_LUA_KW: 1, 
+}
+
+MODEL_LOAD_ATTRIB_RULES = {
+    ( DEEP_SPEECH_KW, LOAD_MODEL_PACKAGE_KW ): 0, 
+    ( MODELS_KW, LOAD_MODEL_KW ): 0, 
+    ( MODEL_KW, LOAD_STATE_DICT_KW ): 0, 
+    ( NETWORK_KW, LOAD_NET_KW ): 0, 
+    ( VGG_KW, LOAD_FROM_NPY_FILE_KW ): 0, 
+    ( CAFFE_PARSER_KW, READ_CAFFE_MODEL_KW ): 0, 
+    # ( TRAIN_KW, CHECK_POINT_KW ): 0, 
+    # ( TF_HUB_KW, LOAD_KW ): 0, 
+    # ( MISC_KW, IMRE_SIZE_KW ): 0, 
+}
+MODEL_LOAD_ASSIGN_RULES = {
+    PATCH_PATH_KW: 1, 
+    # CAFFE_FUNCTION_KW: 1, 
+}
+MODEL_LOAD_CALL_RULES = {
+    LOAD_MODEL_KW: 1, 
+    LOAD_DECODER_KW: 1, 
+    LOAD_PREVIOUS_VALUES_KW: 1, 
+    LOAD_PRETRAINED_KW: 1, 
+    LOAD_PARAM_KW: 1, 
+}
+MODEL_LOAD_MULTI_ASSIGN_RULES = { SEQ_LABEL_KW: 1, LOAD_CHECKPOINT_KW: 1 }
+
+DATA_DOWNLOAD_ATTRIB_RULES = {
+    ( WGET_KW, DOWNLOAD_KW ): 0, 
+    ( REQUEST_KW, URL_OPEN_KW ): 0, 
+    ( MODEL_ZOO_KW, LOAD_URL_KW ): 0, 
+    # ( URL_LIB_KW, URL_RETRIEVE_KW ): 0, 
+    ( AGENT_KW, LOAD_KW ): 0, 
+}
+DATA_DOWNLOAD_CALL_RULES = { PREPARE_URL_IMAGE_KW: 1 }
+
+MODEL_FEATURE_RULES = { ( DATA_KW, HP_BATCH_SIZE_KW ) }
+
+MODEL_LABEL_MULTI_ASSIGN_RULES = {
+    READ_H5FILE_KW: 1, 
+    ARRAY_KW: 1, 
+    CONVERT_KW: 1, 
+    AS_TYPE_KW: 1, 
+    LOAD_DATA_AND_LABELS_KW: 1, 
+    CREATE_DATASET_KW: 1, 
+}
+# ( element, target, iterable ) of a list comprehension assigned to a label variable 
+MODEL_LABEL_TUPLE_RULES = { ( SENT_KW, SENT_KW, INPUT_BATCH_LIST_KW ) }
+
+MODEL_OUTPUT_ATTRIB_RULES = {
+    # ( MODEL_KW, SUMMARY_KW ): 0, 
+    ( DATA_KW, SHOW_DATA_SUMMARY_KW ): 0, 
+}
+MODEL_OUTPUT_ASSIGN_RULES = { GET_TENSOR_KW: 1, EVALUATE_KW: 1, EVAL_KW: 0 }
+MODEL_OUTPUT_SCORE_RULES = {
+    # CONFUSION_MATRIX_KW: 1, 
+    F1_SCORE_KW: 1, 
+    ACCURACY_SCORE_KW: 1, 
+    CLASSIFICATION_LOSS_KW: 1, 
+}
+
+DATA_PIPELINE_ATTRIB_RULES = { ( ARG_PARSE_KW, ARGUMENT_PARSER_KW ): 1 }
+DATA_PIPELINE_ASSIGN_RULES = { TRAIN_EVAL_PIPELINE_CONFIG_KW: 0 }
+DATA_PIPELINE_CALL_RULES = { GET_CONFIGS_FROM_PIPELINE_FILE_KW: 1 }
+DATA_PIPELINE_FEATURE_RULES = { ( PIPELINE_CONFIG_KW, MODEL_KW ) }
+
+ENVIRONMENT_ATTRIB_RULES = {
+    ( WRAPPED_ENV_KW, STEP_KW ): 1, 
+    ( ENV_KW, STEP_KW ): 1, 
+    ( GYM_KW, MAKE_KW ): 1, 
+}
+ENVIRONMENT_FEATURE_RULES = { ( OBSERVATION_SPACE_KW, SHAPE_KW ), ( ACTION_SPACE_KW, SHAPE_KW ) }
+
+STATE_OBSERVE_ATTRIB_RULES = { ( ENV_KW, STEP_KW ): 1 }
+
+DNN_IMPORT_RULES = { KERAS_KW, TORCH_KW }
+DNN_DECISION_ASSIGN_RULES = {
+    PREDICT_KW: 0, 
+    FIT_KW: 0, 
+    EVALUATE_KW: 0, 
+    # RELU_KW: 0, 
+    # POINT_NET_CLS_KW: 0, 
+    # CLS_KW: 0, 
+    # CASCADED_MODEL_KW: 0, 
+    MODEL_KW: 0, 
+    # PERMUTE_KW: 0, 
+    # MINIMUM_KW: 0, 
+    MODEL_C_KW: 0, 
+    # GRAPH_KW: 0, 
+    # VGG_16_GRAPH_KW: 0, 
+}
+
+LOGGING_LIBRARY_RULES = { LOGGING_KW, TENSORFLOW_KW, SYMNET_KW }
+# logging calls with fewer arguments than this are incomplete 
+INCOMPLETE_LOGGING_MAX_ARGS = 3 
+INCOMPLETE_LOGGING_ATTRIB_RULES = {
+    ( LOGGING_KW, GET_LOGGER_KW ), 
+    ( LOGGING_KW, BASIC_CONFIG_KW ), 
+    ( LOGGER_KW, INFO_KW ), 
+    ( TF_KW, LOGGING_KW ), 
+    ( LOGGING_KW, INFO_KW ), 
+}
+
+
+FACT_ATTRIB_CALLS_KW      = 'attrib_calls'
+FACT_FUNC_CALLS_KW        = 'func_calls'
+FACT_FUNC_ASSIGNS_KW      = 'func_assigns'
+FACT_MULTI_LHS_ASSIGNS_KW = 'multi_lhs_assigns'
+FACT_MODEL_FEATURES_KW    = 'model_features'
+FACT_TUPLE_ASSIGNS_KW     = 'tuple_assigns'
+FACT_IMPORTS_KW           = 'imports'
+FACT_IMPORT_NAMES_KW      = 'import_names'
+FACT_EXCEPT_BODY_KW       = 'except_body'
+
+
+PARSE_CACHE_MAX_SIZE = 256 
+CACHE_HITS_KW        = 'hits'
+CACHE_MISSES_KW      = 'misses'
+CACHE_SIZE_KW        = 'size'
+CACHE_MAX_SIZE_KW    = 'max_size'
+PARSE_CACHE_STR      = 'Parse cache: {} hits, {} misses'
+
+
+# bump FACT_CACHE_VERSION whenever a detector changes, so cached counts are recomputed 
+FACT_CACHE_VERSION     = '4'
+FACT_CACHE_DIGEST_SIZE = 20 
+FACT_CACHE_READ_SIZE   = 1048576 
+FACT_CACHE_PRAGMA_SQL  = 'PRAGMA journal_mode=WAL'
+FACT_CACHE_CREATE_SQL  = 'CREATE TABLE IF NOT EXISTS file_facts (content_hash TEXT, cache_version TEXT, parsable INTEGER, counts TEXT, events TEXT, PRIMARY KEY (content_hash, cache_version))'
+FACT_CACHE_COLUMNS_SQL = 'PRAGMA table_info(file_facts)'
+FACT_CACHE_EVENTS_COLUMN = 'events'
+FACT_CACHE_ADD_EVENTS_SQL = 'ALTER TABLE file_facts ADD COLUMN events TEXT'
+FACT_CACHE_SELECT_SQL  = 'SELECT parsable, counts, events FROM file_facts WHERE content_hash = ? AND cache_version = ?'
+FACT_CACHE_INSERT_SQL  = 'INSERT OR REPLACE INTO file_facts (content_hash, cache_version, parsable, counts, events) VALUES (?, ?, ?, ?, ?)'
+CACHE_SERVED_KW        = 'served'
+CACHE_ANALYZED_KW      = 'analyzed'
+FACT_CACHE_STR         = 'Fact cache: {} files served from cache, {} analyzed'
+
+
+POOL_CHUNKS_PER_WORKER = 4 
+POOL_REPO_LOOKAHEAD    = 2 
+
+
+CSV_LINE_END           = '\n'
+# the CSV is flushed after every repo and synced to disk every CSV_SYNC_REPOS repos 
+CSV_SYNC_REPOS         = 100 
+JOURNAL_SUFFIX         = '.journal'
+TEMP_SUFFIX            = '.tmp'
+RESUME_STR             = 'Resuming: {} repos already analyzed will be skipped'
+
+
+SINK_MODE_KW           = 'mode'
+SINK_FILE_KW           = 'file'
+SINK_OPEN_KW           = 'open'
+SINK_SILENT            = 'silent'
+SINK_CONSOLE           = 'console'
+SINK_JSONL             = 'jsonl'
+SINK_MODES             = ( SINK_SILENT, SINK_CONSOLE, SINK_JSONL )
+SINK_MODE_ERROR_STR    = 'Unknown event output {}, expected one of silent, console, jsonl'
+EVENT_FIELDS           = ( 'repo', 'file', 'line', 'category', 'receiver', 'method', 'args', 'logged' )
+EVENT_BUFFER_SIZE      = 10000 
+EVENTS_SUFFIX          = '.events.jsonl'
+NEWLINE_KW             = '\n'
+
+
+# notebooks are analyzed through the code of their code cells, see notebook_reader.py 
+NOTEBOOK_FILE_EXTENSION     = '.ipynb'
+
+
+# synthetic repos for benchmark.py: BENCH_API_DENSITY is the share of lines that are detector matches 
+BENCH_REPO_COUNT       = 4 
+BENCH_FILE_COUNT       = 50 
+BENCH_FILE_LINES       = 200 
+BENCH_API_DENSITY      = 0.1 
+BENCH_REPEAT           = 3 
+BENCH_SEED             = 2020 
+BENCH_REPO_NAME        = 'bench_repo_{}'
+BENCH_FILE_NAME        = 'bench_file_{}.py'
+BENCH_VAR_NAME         = 'var_{}'
+BENCH_ARG_NAME         = 'arg_{}'
+BENCH_FILE_HEADER      = 'import logging\nimport torch\n'
+BENCH_FILLER_LINE      = '{} = {} + {}'
+BENCH_LOG_LINE         = 'logging.info({})'
+BENCH_OUTPUT_FILE      = 'benchmark.json'
+# the detectors main.getFileEventCounts() runs, timed one by one 
+BENCH_DETECTORS        = ( 'getDataLoadCount', 'getDataLoadCountb', 'getDataLoadCountc', 'getModelLoadCounta', 
+                           'getModelLoadCountb', 'getModelLoadCountc', 'getModelLoadCountd', 'getDataDownLoadCount', 
+                           'getDataDownLoadCountb', 'getModelLabelCount', 'getModelOutputCount', 'getModelOutputCountb', 
+                           'getDataPipelineCount', 'getDataPipelineCountb', 'getDataPipelineCountc', 'getEnvironmentCount', 
+                           'getStateObserveCount' )
+BENCH_COMMIT_CMD       = [ 'git', 'rev-parse', 'HEAD' ]
+BENCH_SUMMARY_STR      = '{:<28} {:>14}'
+BENCH_COMPARE_STR      = '{:<28} {:>14} {:>14} {:>8}'
+
+
 DUMMY_LOG_KW = 'pytorch'
 PY_FILE_EXTENSION = '.py'
 ANALYZING_KW = 'Finished Analyzing:'
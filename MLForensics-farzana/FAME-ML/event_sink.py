@@ -0,0 +1,121 @@
+'''
+Structured sink for the events the FAME-ML detectors find
+Detectors report ( event type, line, file, receiver, method, args ) records instead of printing them, the caller
+drains the records of each file and the sink writes them out in batches: not at all, to the console, or as one
+JSON object per event
+'''
+
+import ast
+import json
+import os
+import sys
+import constants
+
+# records reported since the last drainEvents(), i.e. those of the file being analyzed ... only kept while a sink is
+# open, so detectors called on their own leave nothing behind
+EVENT_RECORDS = []
+PENDING_LINES = []
+SINK_STATE    = { constants.SINK_MODE_KW: constants.SINK_CONSOLE, constants.SINK_FILE_KW: None, constants.SINK_OPEN_KW: False }
+
+
+def getArgValue( arg_ ):
+    '''
+    call arguments are mostly names, but a few fact tables keep the AST node of a nested call
+    '''
+    if isinstance( arg_, ast.Name ):
+        return arg_.id
+    if isinstance( arg_, ast.Attribute ):
+        return arg_.attr
+    if isinstance( arg_, ast.AST ):
+        return type( arg_ ).__name__
+    return arg_
+
+
+def reportEvent( event_type, event_line, py_file, receiver=None, method=None, arg_list=() ):
+    if not SINK_STATE[constants.SINK_OPEN_KW]:
+        return
+    arg_tup = tuple( ( getArgValue( arg_ ), arg_pos ) for arg_, arg_pos in arg_list )
+    EVENT_RECORDS.append( ( event_type, event_line, py_file, receiver, method, arg_tup ) )
+
+
+def drainEvents():
+    record_list = list( EVENT_RECORDS )
+    del EVENT_RECORDS[:]
+    return record_list
+
+
+def openEventSink( sink_mode, events_file=None, resume_offset=None ):
+    '''
+    with resume_offset the JSONL file is cut back to that size and appended to, otherwise it is started over
+    '''
+    if sink_mode not in constants.SINK_MODES:
+        raise ValueError( constants.SINK_MODE_ERROR_STR.format( sink_mode ) )
+    closeEventSink()
+    if sink_mode == constants.SINK_JSONL:
+        if ( resume_offset is not None ) and os.path.exists( events_file ):
+            with open( events_file, 'r+b' ) as old_file:
+                old_file.truncate( resume_offset )
+            SINK_STATE[constants.SINK_FILE_KW] = open( events_file, 'a', encoding=constants.UTF_ENCODING )
+        else:
+            SINK_STATE[constants.SINK_FILE_KW] = open( events_file, 'w', encoding=constants.UTF_ENCODING )
+    SINK_STATE[constants.SINK_MODE_KW] = sink_mode
+    SINK_STATE[constants.SINK_OPEN_KW] = True
+
+
+def openWorkerSink():
+    '''
+    process pool initializer: a worker only collects records for the parent to emit ... a sink inherited through 
+    fork is let go unflushed, its pending lines are the parent's to write 
+    '''
+    del EVENT_RECORDS[:]
+    del PENDING_LINES[:]
+    SINK_STATE[constants.SINK_FILE_KW] = None
+    SINK_STATE[constants.SINK_MODE_KW] = constants.SINK_SILENT
+    SINK_STATE[constants.SINK_OPEN_KW] = True
+
+
+def getEventJSON( dir_repo, event_record ):
+    event_type, event_line, py_file, receiver, method, arg_tup, logged_flag = event_record
+    return json.dumps( dict( zip( constants.EVENT_FIELDS, ( dir_repo, py_file, event_line, event_type, receiver, method, arg_tup, logged_flag ) ) ) )
+
+
+def emitEvents( record_list, dir_repo=None ):
+    sink_mode = SINK_STATE[constants.SINK_MODE_KW]
+    if sink_mode == constants.SINK_CONSOLE:
+        PENDING_LINES.extend( constants.CONSOLE_STR_DISPLAY.format( record_[0], record_[1], record_[2] ) for record_ in record_list )
+    elif sink_mode == constants.SINK_JSONL:
+        PENDING_LINES.extend( getEventJSON( dir_repo, record_ ) for record_ in record_list )
+    if len( PENDING_LINES ) >= constants.EVENT_BUFFER_SIZE:
+        flushEvents()
+
+
+def flushEvents():
+    '''
+    one write per batch instead of one print per event, then the events file size if there is one
+    '''
+    out_file = SINK_STATE[constants.SINK_FILE_KW]
+    if out_file is None:
+        out_file = sys.stdout
+    if len( PENDING_LINES ) > 0:
+        out_file.write( constants.NEWLINE_KW.join( PENDING_LINES ) + constants.NEWLINE_KW )
+        del PENDING_LINES[:]
+    out_file.flush()
+    if SINK_STATE[constants.SINK_FILE_KW] is None:
+        return None
+    return os.fstat( out_file.fileno() ).st_size
+
+
+def syncEvents():
+    if SINK_STATE[constants.SINK_FILE_KW] is not None:
+        os.fsync( SINK_STATE[constants.SINK_FILE_KW].fileno() )
+
+
+def closeEventSink():
+    flushEvents()
+    if SINK_STATE[constants.SINK_FILE_KW] is not None:
+        syncEvents()
+        SINK_STATE[constants.SINK_FILE_KW].close()
+    SINK_STATE[constants.SINK_FILE_KW] = None
+    SINK_STATE[constants.SINK_MODE_KW] = constants.SINK_CONSOLE
+    SINK_STATE[constants.SINK_OPEN_KW] = False
+    del EVENT_RECORDS[:]
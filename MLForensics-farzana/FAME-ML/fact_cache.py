@@ -0,0 +1,97 @@
+'''
+Persistent per-file fact cache for incremental FAME-ML runs
+Files are keyed by a hash of their content, so an unchanged file is never parsed or analyzed twice
+'''
+
+import hashlib
+import json
+import os
+import sqlite3
+import constants
+
+# content hash per path for the current repo, keyed like the parse cache so edits are noticed
+CONTENT_HASHES = {}
+FACT_CACHE_STATS = { constants.CACHE_SERVED_KW: 0, constants.CACHE_ANALYZED_KW: 0 }
+
+
+def openFactCache( cache_file ):
+    cache_conn = sqlite3.connect( cache_file )
+    cache_conn.execute( constants.FACT_CACHE_PRAGMA_SQL )
+    cache_conn.execute( constants.FACT_CACHE_CREATE_SQL )
+    column_list = [ row_[1] for row_ in cache_conn.execute( constants.FACT_CACHE_COLUMNS_SQL ) ]
+    if constants.FACT_CACHE_EVENTS_COLUMN not in column_list:
+        cache_conn.execute( constants.FACT_CACHE_ADD_EVENTS_SQL )
+    cache_conn.commit()
+    return cache_conn
+
+
+def commitFactCache( cache_conn ):
+    '''
+    called once a repo is done, which is also when its hashes are no longer needed
+    '''
+    cache_conn.commit()
+    CONTENT_HASHES.clear()
+
+
+def closeFactCache( cache_conn ):
+    commitFactCache( cache_conn )
+    cache_conn.close()
+
+
+def getContentHash( py_file ):
+    stat_ = os.stat( py_file )
+    stat_key = ( stat_.st_mtime_ns, stat_.st_size )
+    if py_file in CONTENT_HASHES and CONTENT_HASHES[py_file][0] == stat_key:
+        return CONTENT_HASHES[py_file][1]
+    hash_obj = hashlib.blake2b( digest_size=constants.FACT_CACHE_DIGEST_SIZE )
+    with open( py_file, 'rb' ) as file_:
+        for block_ in iter( lambda: file_.read( constants.FACT_CACHE_READ_SIZE ), b'' ):
+            hash_obj.update( block_ )
+    content_hash = hash_obj.hexdigest()
+    CONTENT_HASHES[py_file] = ( stat_key, content_hash )
+    return content_hash
+
+
+def getCachedRow( cache_conn, py_file ):
+    '''
+    returns (parsable, counts, events) for py_file, or None if this content was never seen
+    '''
+    cursor_ = cache_conn.execute( constants.FACT_CACHE_SELECT_SQL, ( getContentHash( py_file ), constants.FACT_CACHE_VERSION ) )
+    return cursor_.fetchone()
+
+
+def getCachedParsable( cache_conn, py_file ):
+    row_ = getCachedRow( cache_conn, py_file )
+    if row_ is None:
+        return None
+    return bool( row_[0] )
+
+
+def getCachedResult( cache_conn, py_file ):
+    '''
+    returns (counts, event records) for py_file, or None ... events are stored without the path, since the same
+    content can live under several paths
+    '''
+    row_ = getCachedRow( cache_conn, py_file )
+    if ( row_ is None ) or ( row_[1] is None ):
+        return None
+    FACT_CACHE_STATS[constants.CACHE_SERVED_KW] += 1
+    event_list = [ ( event_type, event_line, py_file, receiver, method, tuple( tuple( arg_ ) for arg_ in arg_list ), logged_flag ) \
+                   for event_type, event_line, receiver, method, arg_list, logged_flag in json.loads( row_[2] ) ]
+    return tuple( json.loads( row_[1] ) ), event_list
+
+
+def storeResult( cache_conn, py_file, count_tup, event_list=() ):
+    FACT_CACHE_STATS[constants.CACHE_ANALYZED_KW] += 1
+    event_json = json.dumps( [ ( event_type, event_line, receiver, method, arg_tup, logged_flag ) \
+                               for event_type, event_line, event_file, receiver, method, arg_tup, logged_flag in event_list ] )
+    cache_conn.execute( constants.FACT_CACHE_INSERT_SQL, ( getContentHash( py_file ), constants.FACT_CACHE_VERSION, 1, \
+                        json.dumps( list( count_tup ) ), event_json ) )
+
+
+def storeUnparsable( cache_conn, py_file ):
+    cache_conn.execute( constants.FACT_CACHE_INSERT_SQL, ( getContentHash( py_file ), constants.FACT_CACHE_VERSION, 0, None, None ) )
+
+
+def getFactCacheStats():
+    return dict( FACT_CACHE_STATS )
@@ -6,12 +6,16 @@ Main executor
 '''
 import lint_engine
 import constants 
+import fact_cache 
+import event_sink 
 import time 
 import datetime 
 import os 
-import pandas as pd
+import csv 
 import py_parser 
-import numpy as np 
+import argparse 
+import collections 
+import concurrent.futures 
 
 
 def giveTimeStamp():
@@ -20,155 +24,405 @@ def giveTimeStamp():
   return strToret
   
 
-def getCSVData(dic_, dir_repo):
-	temp_list = []
-	for TEST_ML_SCRIPT in dic_:
-		# print(constants.ANALYZING_KW + TEST_ML_SCRIPT) 
-		# Section 1.1a
-		data_load_counta = lint_engine.getDataLoadCount( TEST_ML_SCRIPT ) 
+def getFileEventCounts(TEST_ML_SCRIPT):
+	'''
+	runs every detector on one file, returns the event counts in CSV column order and the event records the 
+	detectors reported, each flagged with whether its data is logged in the file 
+	'''
+	# print(constants.ANALYZING_KW + TEST_ML_SCRIPT) 
+	# one parse and one walk per file, all detectors below read from these fact tables 
+	py_tree    = py_parser.getPythonParseObject( TEST_ML_SCRIPT )
+	file_facts = py_parser.getFileFacts( py_tree )
 
-		# Section 1.1b
-		data_load_countb = lint_engine.getDataLoadCountb( TEST_ML_SCRIPT ) 
+	# Section 1.1a
+	data_load_counta = lint_engine.getDataLoadCount( TEST_ML_SCRIPT, file_facts ) 
 
-		# Section 1.1c
-		data_load_countc = lint_engine.getDataLoadCountc( TEST_ML_SCRIPT ) 
+	# Section 1.1b
+	data_load_countb = lint_engine.getDataLoadCountb( TEST_ML_SCRIPT, file_facts ) 
 
-		# Section 1.2a
-		model_load_counta = lint_engine.getModelLoadCounta( TEST_ML_SCRIPT ) 
+	# Section 1.1c
+	data_load_countc = lint_engine.getDataLoadCountc( TEST_ML_SCRIPT, file_facts ) 
 
-		# Section 1.2b
-		model_load_countb = lint_engine.getModelLoadCountb( TEST_ML_SCRIPT ) 
+	# Section 1.2a
+	model_load_counta = lint_engine.getModelLoadCounta( TEST_ML_SCRIPT, file_facts ) 
 
-		# Section 1.2c
-		model_load_countc = lint_engine.getModelLoadCountc( TEST_ML_SCRIPT ) 
+	# Section 1.2b
+	model_load_countb = lint_engine.getModelLoadCountb( TEST_ML_SCRIPT, file_facts ) 
 
-		# Section 1.2d
-		model_load_countd = lint_engine.getModelLoadCountd( TEST_ML_SCRIPT ) 
+	# Section 1.2c
+	model_load_countc = lint_engine.getModelLoadCountc( TEST_ML_SCRIPT, file_facts ) 
 
-		# Section 2.1a
-		data_download_counta = lint_engine.getDataDownLoadCount( TEST_ML_SCRIPT ) 
+	# Section 1.2d
+	model_load_countd = lint_engine.getModelLoadCountd( TEST_ML_SCRIPT, file_facts ) 
 
-		# Section 2.1b
-		data_download_countb = lint_engine.getDataDownLoadCountb( TEST_ML_SCRIPT )
+	# Section 2.1a
+	data_download_counta = lint_engine.getDataDownLoadCount( TEST_ML_SCRIPT, file_facts ) 
 
-		# Section 3.1
-		# # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md
-		# model_feature_count = lint_engine.getModelFeatureCount( TEST_ML_SCRIPT ) 
+	# Section 2.1b
+	data_download_countb = lint_engine.getDataDownLoadCountb( TEST_ML_SCRIPT, file_facts )
 
-		# Section 3.2a
-		model_label_counta = lint_engine.getModelLabelCount( TEST_ML_SCRIPT ) 
-	
-		# Section 3.2b
-		# # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md
-		# model_label_countb = lint_engine.getModelLabelCountb( TEST_ML_SCRIPT ) 
+	# Section 3.1
+	# # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md
+	# model_feature_count = lint_engine.getModelFeatureCount( TEST_ML_SCRIPT, file_facts ) 
 
-		# Section 3.3a
-		model_output_counta = lint_engine.getModelOutputCount( TEST_ML_SCRIPT ) 
-	
-		# Section 3.3b
-		model_output_countb = lint_engine.getModelOutputCountb( TEST_ML_SCRIPT ) 
+	# Section 3.2a
+	model_label_counta = lint_engine.getModelLabelCount( TEST_ML_SCRIPT, file_facts ) 
 
-		# Section 3.3c
-		# # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md
-		# model_output_countc = lint_engine.getModelOutputCountc( TEST_ML_SCRIPT ) 
+	# Section 3.2b
+	# # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md
+	# model_label_countb = lint_engine.getModelLabelCountb( TEST_ML_SCRIPT, file_facts ) 
 
-		# Section 4.1
-		data_pipeline_counta = lint_engine.getDataPipelineCount( TEST_ML_SCRIPT ) 
+	# Section 3.3a
+	model_output_counta = lint_engine.getModelOutputCount( TEST_ML_SCRIPT, file_facts ) 
 
-		# Section 4.2
-		data_pipeline_countb = lint_engine.getDataPipelineCountb( TEST_ML_SCRIPT ) 
+	# Section 3.3b
+	model_output_countb = lint_engine.getModelOutputCountb( TEST_ML_SCRIPT, file_facts ) 
 
-		# Section 4.3
-		data_pipeline_countc = lint_engine.getDataPipelineCountc( TEST_ML_SCRIPT ) 
+	# Section 3.3c
+	# # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md
+	# model_output_countc = lint_engine.getModelOutputCountc( TEST_ML_SCRIPT, file_facts ) 
 
-		# Section 4.4
-		# # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md
-		# data_pipeline_countd = lint_engine.getDataPipelineCountd( TEST_ML_SCRIPT ) 
+	# Section 4.1
+	data_pipeline_counta = lint_engine.getDataPipelineCount( TEST_ML_SCRIPT, file_facts ) 
 
-		# Section 5.1a
-		environment_counta = lint_engine.getEnvironmentCount( TEST_ML_SCRIPT ) 
+	# Section 4.2
+	data_pipeline_countb = lint_engine.getDataPipelineCountb( TEST_ML_SCRIPT, file_facts ) 
 
-		# Section 5.1b
-		# # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md 
-		# environment_countb = lint_engine.getEnvironmentCountb( TEST_ML_SCRIPT ) 
+	# Section 4.3
+	data_pipeline_countc = lint_engine.getDataPipelineCountc( TEST_ML_SCRIPT, file_facts ) 
 
-		# Section 5.2
-		state_observe_count = lint_engine.getStateObserveCount( TEST_ML_SCRIPT ) 
+	# Section 4.4
+	# # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md
+	# data_pipeline_countd = lint_engine.getDataPipelineCountd( TEST_ML_SCRIPT, file_facts ) 
 
-		# Section 6.2 , skipping as syntax analysis will yield false positives 
-		# dnn_decision_countb = lint_engine.getDNNDecisionCountb( TEST_ML_SCRIPT ) 
-		# the following checks except related blocks 
+	# Section 5.1a
+	environment_counta = lint_engine.getEnvironmentCount( TEST_ML_SCRIPT, file_facts ) 
 
-		# Section 7
-		# except_flag = lint_engine.getExcepts( TEST_ML_SCRIPT ) 
+	# Section 5.1b
+	# # skipping as per https://github.com/paser-group/MLForensics/blob/farzana/Verb.Object.Mapping.md 
+	# environment_countb = lint_engine.getEnvironmentCountb( TEST_ML_SCRIPT, file_facts ) 
 
-		# Section 8
-		# incomplete_logging_count = lint_engine.getIncompleteLoggingCount( TEST_ML_SCRIPT ) 
-		
-		data_load_count = data_load_counta + data_load_countb + data_load_countc
-		model_load_count = model_load_counta + model_load_countb + model_load_countc + model_load_countd
-		data_download_count = data_download_counta + data_download_countb
-		# model_label_count = model_label_counta + model_label_countb
-		model_label_count = model_label_counta 
-		# model_output_count = model_output_counta + model_output_countb + model_output_countc
-		model_output_count = model_output_counta + model_output_countb 
-		# data_pipeline_count = data_pipeline_counta + data_pipeline_countb + data_pipeline_countc + data_pipeline_countd
-		data_pipeline_count = data_pipeline_counta + data_pipeline_countb + data_pipeline_countc 
-		# environment_count = environment_counta + environment_countb
-		environment_count  = environment_counta 
-		# dnn_decision_count = dnn_decision_countb
-		
-		# the_tup = ( dir_repo, TEST_ML_SCRIPT, data_load_count, model_load_count, data_download_count, model_feature_count, \
+	# Section 5.2
+	state_observe_count = lint_engine.getStateObserveCount( TEST_ML_SCRIPT, file_facts ) 
+
+	# Section 6.2 , skipping as syntax analysis will yield false positives 
+	# dnn_decision_countb = lint_engine.getDNNDecisionCountb( TEST_ML_SCRIPT, file_facts ) 
+	# the following checks except related blocks 
+
+	# Section 7
+	# except_flag = lint_engine.getExcepts( TEST_ML_SCRIPT, file_facts ) 
+
+	# Section 8
+	# incomplete_logging_count = lint_engine.getIncompleteLoggingCount( TEST_ML_SCRIPT, file_facts ) 
+	
+	data_load_count = data_load_counta + data_load_countb + data_load_countc
+	model_load_count = model_load_counta + model_load_countb + model_load_countc + model_load_countd
+	data_download_count = data_download_counta + data_download_countb
+	# model_label_count = model_label_counta + model_label_countb
+	model_label_count = model_label_counta 
+	# model_output_count = model_output_counta + model_output_countb + model_output_countc
+	model_output_count = model_output_counta + model_output_countb 
+	# data_pipeline_count = data_pipeline_counta + data_pipeline_countb + data_pipeline_countc + data_pipeline_countd
+	data_pipeline_count = data_pipeline_counta + data_pipeline_countb + data_pipeline_countc 
+	# environment_count = environment_counta + environment_countb
+	environment_count  = environment_counta 
+	# dnn_decision_count = dnn_decision_countb
+	
+	# the_tup = ( dir_repo, TEST_ML_SCRIPT, data_load_count, model_load_count, data_download_count, model_feature_count, \
   		# 		  model_label_count, model_output_count, data_pipeline_count, environment_count, state_observe_count, \
   		# 		  dnn_decision_count, incomplete_logging_count, except_flag)
-		'''
-		Total security-related logging event count 
-		'''
-		
-		total_event_count = data_load_count   + model_load_count    + data_download_count + \
-		                    model_label_count + model_output_count  + data_pipeline_count + \
-							environment_count + state_observe_count 
-		
-		the_tup = ( dir_repo, TEST_ML_SCRIPT, data_load_count, model_load_count, data_download_count, \
+	'''
+	Total security-related logging event count 
+	'''
+	
+	total_event_count = data_load_count   + model_load_count    + data_download_count + \
+	                    model_label_count + model_output_count  + data_pipeline_count + \
+						environment_count + state_observe_count 
+	
+	count_tup = ( data_load_count, model_load_count, data_download_count, \
   				  model_label_count, model_output_count, data_pipeline_count, environment_count, state_observe_count, total_event_count )
+	return count_tup, lint_engine.getLoggedEvents( event_sink.drainEvents(), file_facts ) 
+
+
+def getCSVData(file_list, dir_repo, fact_cache_conn=None):
+	temp_list = []
+	for TEST_ML_SCRIPT in file_list:
+		cached_result = None 
+		if fact_cache_conn is not None:
+			cached_result = fact_cache.getCachedResult( fact_cache_conn, TEST_ML_SCRIPT ) 
+		if cached_result is None:
+			count_tup, event_list = getFileEventCounts( TEST_ML_SCRIPT ) 
+			if fact_cache_conn is not None:
+				fact_cache.storeResult( fact_cache_conn, TEST_ML_SCRIPT, count_tup, event_list ) 
+		else:
+			count_tup, event_list = cached_result 
+		event_sink.emitEvents( event_list, dir_repo ) 
+		the_tup = ( dir_repo, TEST_ML_SCRIPT ) + tuple( count_tup )
 
 		temp_list.append( the_tup )
 		# print('='*25)
 	return temp_list
   
   
-def getAllPythonFilesinRepo(path2dir):
-	valid_list = []
+def checkIfParsableWithCache(full_path_file, fact_cache_conn=None):
+	'''
+	files already in the fact cache are not parsed again just to find out if they parse ... the tree of a file that 
+	is parsed stays in the bounded parse cache, where the detectors find it 
+	'''
+	flag = None 
+	if fact_cache_conn is not None:
+		flag = fact_cache.getCachedParsable( fact_cache_conn, full_path_file ) 
+	if flag is None:
+		flag = py_parser.checkIfParsablePython( full_path_file ) 
+		if ( fact_cache_conn is not None ) and ( not flag ):
+			fact_cache.storeUnparsable( fact_cache_conn, full_path_file ) 
+	return flag 
+
+
+def getAllPythonFilesinRepo(path2dir, fact_cache_conn=None, check_parsable=True, include_notebooks=False):
+	'''
+	parsable .py files in walk order, with check_parsable=False the parse check is left to the caller, e.g. to 
+	analyzeRepo() or the process pool workers ... include_notebooks adds .ipynb files, analyzed through the code 
+	of their code cells 
+	'''
+	valid_list, seen_set = [], set() 
 	for root_, dirnames, filenames in os.walk(path2dir):
 		for file_ in filenames:
 			full_path_file = os.path.join(root_, file_) 
-			if( os.path.exists( full_path_file ) ):
-				if (file_.endswith( constants.PY_FILE_EXTENSION ) and (py_parser.checkIfParsablePython( full_path_file ) )   ):
-					valid_list.append(full_path_file) 
-	valid_list = np.unique(  valid_list )
+			if( ( full_path_file not in seen_set ) and os.path.exists( full_path_file ) ):
+				if (file_.endswith( constants.PY_FILE_EXTENSION ) ) or ( include_notebooks and file_.endswith( constants.NOTEBOOK_FILE_EXTENSION ) ):
+					seen_set.add( full_path_file )
+					if ( not check_parsable ) or checkIfParsableWithCache( full_path_file, fact_cache_conn ):
+						valid_list.append( full_path_file ) 
 	return valid_list
 
 
-def runFameML(inp_dir, csv_fil):
+def analyzeRepo(dir_repo, fact_cache_conn=None, include_notebooks=False):
+	'''
+	serial counterpart of collectRepoFromPool(): each file is checked and then analyzed right away, so its detectors 
+	find the tree of the check in the parse cache and no more than that cache holds is kept in memory 
+	'''
+	valid_list, temp_list = [], [] 
+	for TEST_ML_SCRIPT in getAllPythonFilesinRepo( dir_repo, check_parsable=False, include_notebooks=include_notebooks ):
+		if checkIfParsableWithCache( TEST_ML_SCRIPT, fact_cache_conn ):
+			valid_list.append( TEST_ML_SCRIPT )
+			temp_list.extend( getCSVData( [ TEST_ML_SCRIPT ], dir_repo, fact_cache_conn ) )
+	return valid_list, temp_list 
+
+
+def analyzeFileInWorker(TEST_ML_SCRIPT):
+	'''
+	process pool task: parse check plus all detectors for one file ... returns ( counts and events, None if the file 
+	does not parse, parse cache hits, parse cache misses ), the lookups this file cost in the worker's own cache 
+	'''
+	stats_before = py_parser.getParseCacheStats() 
+	file_result  = None 
+	if py_parser.checkIfParsablePython( TEST_ML_SCRIPT ):
+		file_result = getFileEventCounts( TEST_ML_SCRIPT ) 
+	stats_after  = py_parser.getParseCacheStats() 
+	return file_result, stats_after[constants.CACHE_HITS_KW] - stats_before[constants.CACHE_HITS_KW], \
+	       stats_after[constants.CACHE_MISSES_KW] - stats_before[constants.CACHE_MISSES_KW] 
+
+
+def submitRepoToPool(dir_repo, executor_, workers, fact_cache_conn=None, include_notebooks=False):
+	'''
+	resolves what the fact cache already knows and sends the remaining files of one repo to the pool 
+	'''
+	candidate_list = getAllPythonFilesinRepo( dir_repo, fact_cache_conn, check_parsable=False, include_notebooks=include_notebooks ) 
+	cached_dict, pending_list = {}, [] 
+	for TEST_ML_SCRIPT in candidate_list:
+		if fact_cache_conn is not None:
+			flag = fact_cache.getCachedParsable( fact_cache_conn, TEST_ML_SCRIPT ) 
+			if flag is False:
+				continue 
+			if flag:
+				cached_result = fact_cache.getCachedResult( fact_cache_conn, TEST_ML_SCRIPT ) 
+				if cached_result is not None:
+					cached_dict[TEST_ML_SCRIPT] = cached_result 
+					continue 
+		pending_list.append( TEST_ML_SCRIPT )
+	chunk_size = max( 1, len(pending_list) // ( workers * constants.POOL_CHUNKS_PER_WORKER ) )
+	result_iter = executor_.map( analyzeFileInWorker, pending_list, chunksize=chunk_size ) 
+	return dir_repo, candidate_list, cached_dict, pending_list, result_iter 
+
+
+def collectRepoFromPool(pool_job, fact_cache_conn=None):
+	'''
+	waits for one repo submitted by submitRepoToPool() and builds its rows in the same order as getCSVData() 
+	'''
+	dir_repo, candidate_list, cached_dict, pending_list, result_iter = pool_job 
+	result_dict = {} 
+	for TEST_ML_SCRIPT, ( file_result, parse_hits, parse_misses ) in zip( pending_list, result_iter ):
+		result_dict[TEST_ML_SCRIPT] = file_result 
+		py_parser.addParseCacheStats( parse_hits, parse_misses ) 
+	valid_list, temp_list = [], [] 
+	for TEST_ML_SCRIPT in candidate_list:
+		if TEST_ML_SCRIPT in cached_dict:
+			count_tup, event_list = cached_dict[TEST_ML_SCRIPT]
+		elif result_dict.get( TEST_ML_SCRIPT ) is not None:
+			count_tup, event_list = result_dict[TEST_ML_SCRIPT]
+			if fact_cache_conn is not None:
+				fact_cache.storeResult( fact_cache_conn, TEST_ML_SCRIPT, count_tup, event_list ) 
+		else:
+			if ( fact_cache_conn is not None ) and ( TEST_ML_SCRIPT in result_dict ):
+				fact_cache.storeUnparsable( fact_cache_conn, TEST_ML_SCRIPT ) 
+			continue 
+		event_sink.emitEvents( event_list, dir_repo ) 
+		valid_list.append( TEST_ML_SCRIPT )
+		temp_list.append( ( dir_repo, TEST_ML_SCRIPT ) + tuple( count_tup ) )
+	return dir_repo, valid_list, temp_list 
+
+
+def loadJournal(csv_fil, events_fil=None):
+	'''
+	repos finished by an earlier run, mapped to the CSV size and the events file size right after their output ... 
+	a torn last line and entries pointing past the end of either file (output that never reached the disk) are dropped 
+	'''
+	done_dict = {}
+	journal_fil = csv_fil + constants.JOURNAL_SUFFIX 
+	if not ( os.path.exists( journal_fil ) and os.path.exists( csv_fil ) ):
+		return done_dict 
+	csv_size = os.path.getsize( csv_fil ) 
+	events_size = None 
+	if ( events_fil is not None ) and os.path.exists( events_fil ):
+		events_size = os.path.getsize( events_fil ) 
+	with open( journal_fil, 'r', newline=constants.EMPTY_STRING, encoding=constants.UTF_ENCODING ) as journal_file:
+		line_list = [ line_ for line_ in journal_file if line_.endswith( constants.CSV_LINE_END ) ]
+	for journal_row in csv.reader( line_list ):
+		csv_offset, dir_repo, events_offset = int( journal_row[0] ), journal_row[1], None 
+		if ( len(journal_row) > 2 ) and ( journal_row[2] != constants.EMPTY_STRING ):
+			events_offset = int( journal_row[2] )
+		if ( csv_offset > csv_size ) or ( ( events_offset is not None ) and ( events_size is not None ) and ( events_offset > events_size ) ):
+			break 
+		done_dict[dir_repo] = ( csv_offset, events_offset )
+	return done_dict 
+
+
+def openCSVStream(csv_fil, done_dict=None):
+	'''
+	rows are appended as each repo finishes instead of being kept for one DataFrame at the end, so memory stays flat 
+	and a crash keeps every finished repo ... next to the CSV a journal records each finished repo, and when resuming 
+	the CSV is cut back to the last journaled repo so half written rows are redone 
+	'''
+	journal_fil = csv_fil + constants.JOURNAL_SUFFIX 
+	if not done_dict:
+		csv_file = open( csv_fil, 'w', newline=constants.EMPTY_STRING, encoding=constants.UTF_ENCODING )
+		csv.writer( csv_file, lineterminator=constants.CSV_LINE_END ).writerow( constants.CSV_HEADER )
+		journal_file = open( journal_fil, 'w', newline=constants.EMPTY_STRING, encoding=constants.UTF_ENCODING )
+		return csv_file, journal_file 
+	with open( csv_fil, 'r+b' ) as old_file:
+		old_file.truncate( max( csv_offset for csv_offset, events_offset in done_dict.values() ) )
+	temp_fil = journal_fil + constants.TEMP_SUFFIX 
+	with open( temp_fil, 'w', newline=constants.EMPTY_STRING, encoding=constants.UTF_ENCODING ) as temp_file:
+		csv.writer( temp_file, lineterminator=constants.CSV_LINE_END ).writerows( getJournalRow( dir_repo, csv_offset, events_offset ) \
+		                                                                          for dir_repo, ( csv_offset, events_offset ) in done_dict.items() )
+	os.replace( temp_fil, journal_fil )
+	csv_file = open( csv_fil, 'a', newline=constants.EMPTY_STRING, encoding=constants.UTF_ENCODING )
+	journal_file = open( journal_fil, 'a', newline=constants.EMPTY_STRING, encoding=constants.UTF_ENCODING )
+	return csv_file, journal_file 
+
+
+def getJournalRow(dir_repo, csv_offset, events_offset=None):
+	if events_offset is None:
+		events_offset = constants.EMPTY_STRING 
+	return ( csv_offset, dir_repo, events_offset )
+
+
+def closeCSVStream(scan_output):
+	for file_ in scan_output:
+		file_.flush()
+		os.fsync( file_.fileno() )
+		file_.close()
+
+
+def finishRepo(dir_repo, events_with_dic, temp_list, output_event_dict, scan_output, fact_cache_conn=None):
+	'''
+	checkpoint once all rows of a repo are known: append them to the CSV, flush the CSV and the buffered events, 
+	journal the repo, and commit the fact cache ... the journal line is only written after the output, and synced 
+	after it too 
+	'''
+	csv_file, journal_file = scan_output 
+	if dir_repo not in output_event_dict:
+		output_event_dict[dir_repo] = list( events_with_dic )
+	csv.writer( csv_file, lineterminator=constants.CSV_LINE_END ).writerows( temp_list )
+	csv_file.flush()
+	events_size = event_sink.flushEvents() 
+	csv.writer( journal_file, lineterminator=constants.CSV_LINE_END ).writerow( getJournalRow( dir_repo, os.fstat( csv_file.fileno() ).st_size, events_size ) )
+	journal_file.flush()
+	if len( output_event_dict ) % constants.CSV_SYNC_REPOS == 0:
+		os.fsync( csv_file.fileno() )
+		event_sink.syncEvents() 
+		os.fsync( journal_file.fileno() )
+	if fact_cache_conn is not None:
+		fact_cache.commitFactCache( fact_cache_conn ) 
+	print(constants.ANALYZING_KW, dir_repo)
+	print('-'*50)
+
+
+def runFameMLParallel(list_subfolders_with_paths, output_event_dict, workers, scan_output, fact_cache_conn=None, include_notebooks=False):
+	'''
+	fans per-file analysis out to a process pool ... a few repos are kept in flight so small repos do not leave 
+	workers idle, and repos are collected in submission order so rows come out exactly as in the serial run 
+	'''
+	pool_jobs = collections.deque()
+	with concurrent.futures.ProcessPoolExecutor( max_workers=workers, initializer=event_sink.openWorkerSink ) as executor_:
+		for subfolder in list_subfolders_with_paths + [ None ]: 
+			if subfolder is not None:
+				pool_jobs.append( submitRepoToPool( subfolder, executor_, workers, fact_cache_conn, include_notebooks ) )
+			while ( len(pool_jobs) > workers * constants.POOL_REPO_LOOKAHEAD ) or ( ( subfolder is None ) and ( len(pool_jobs) > 0 ) ):
+				dir_repo, events_with_dic, temp_list = collectRepoFromPool( pool_jobs.popleft(), fact_cache_conn )
+				finishRepo( dir_repo, events_with_dic, temp_list, output_event_dict, scan_output, fact_cache_conn )
+
+
+def runFameML(inp_dir, csv_fil, cache_file=None, workers=1, resume=False, event_mode=constants.SINK_CONSOLE, events_fil=None, 
+              include_notebooks=False):
+	'''
+	event_mode picks where the detected events go: silent, console ( the default ) or jsonl, by default written next 
+	to the CSV ... include_notebooks also analyzes the code cells of .ipynb files 
+	'''
 	output_event_dict = {}
-	df_list = [] 
-	list_subfolders_with_paths = [f.path for f in os.scandir(inp_dir) if f.is_dir()]
-	for subfolder in list_subfolders_with_paths: 
-		events_with_dic =  getAllPythonFilesinRepo(subfolder)  
-		if subfolder not in output_event_dict:
-			output_event_dict[subfolder] = events_with_dic
-		temp_list  = getCSVData(events_with_dic, subfolder)
-		df_list    = df_list + temp_list 
-		print(constants.ANALYZING_KW, subfolder)
-		print('-'*50)
-	full_df = pd.DataFrame( df_list ) 
-	# print(full_df.head())
-	full_df.to_csv(csv_fil, header= constants.CSV_HEADER, index=False, encoding= constants.UTF_ENCODING)     
+	fact_cache_conn = None 
+	if cache_file is not None:
+		fact_cache_conn = fact_cache.openFactCache( cache_file ) 
+	if events_fil is None:
+		events_fil = csv_fil + constants.EVENTS_SUFFIX 
+	done_dict, events_offset = {}, None 
+	if resume:
+		done_dict = loadJournal( csv_fil, events_fil ) 
+		print( constants.RESUME_STR.format( len(done_dict) ) )
+	if len(done_dict) > 0:
+		events_offset = list( done_dict.values() )[-1][1] 
+	event_sink.openEventSink( event_mode, events_fil, events_offset ) 
+	scan_output = openCSVStream( csv_fil, done_dict ) 
+	list_subfolders_with_paths = [f.path for f in os.scandir(inp_dir) if f.is_dir() and f.path not in done_dict]
+	try:
+		if workers > 1:
+			runFameMLParallel( list_subfolders_with_paths, output_event_dict, workers, scan_output, fact_cache_conn, include_notebooks )
+		else:
+			for subfolder in list_subfolders_with_paths: 
+				events_with_dic, temp_list = analyzeRepo( subfolder, fact_cache_conn, include_notebooks ) 
+				finishRepo( subfolder, events_with_dic, temp_list, output_event_dict, scan_output, fact_cache_conn )
+	finally:
+		closeCSVStream( scan_output ) 
+		event_sink.closeEventSink() 
+	cache_stats = py_parser.getParseCacheStats()
+	print( constants.PARSE_CACHE_STR.format( cache_stats[constants.CACHE_HITS_KW], cache_stats[constants.CACHE_MISSES_KW] ) )
+	if fact_cache_conn is not None:
+		fact_cache.closeFactCache( fact_cache_conn ) 
+		fact_stats = fact_cache.getFactCacheStats() 
+		print( constants.FACT_CACHE_STR.format( fact_stats[constants.CACHE_SERVED_KW], fact_stats[constants.CACHE_ANALYZED_KW] ) )
 	return output_event_dict
 
 
 if __name__=='__main__':
 	command_line_flag = False ## after acceptance   
+	arg_parser = argparse.ArgumentParser()
+	arg_parser.add_argument('--workers', type=int, default=1, help='number of analysis processes, 1 runs serially')
+	arg_parser.add_argument('--resume', action='store_true', help='skip repos the journal of an earlier run marks as done')
+	arg_parser.add_argument('--events', choices=constants.SINK_MODES, default=constants.SINK_CONSOLE, help='where detected events go')
+	arg_parser.add_argument('--events-file', default=None, help='JSONL file for --events jsonl, defaults to the CSV name plus ' + constants.EVENTS_SUFFIX)
+	arg_parser.add_argument('--notebooks', action='store_true', help='also analyze the code cells of Jupyter notebooks')
+	cli_args = arg_parser.parse_args()
 
 	t1 = time.time()
 	print('Started at:', giveTimeStamp() )
@@ -181,11 +435,15 @@ if __name__=='__main__':
 			repo_dir    = dir_path 
 			output_file = dir_path.split('/')[-2]
 			output_csv = '/Users/arahman/Documents/OneDriveWingUp/OneDrive-TennesseeTechUniversity/Research/VulnStrategyMining/ForensicsinML/Output/V5_' + output_file + '.csv'
-			full_dict  = runFameML(repo_dir, output_csv)
+			cache_file = '/Users/arahman/Documents/OneDriveWingUp/OneDrive-TennesseeTechUniversity/Research/VulnStrategyMining/ForensicsinML/Output/V5_FACT_CACHE.sqlite'
+			full_dict  = runFameML(repo_dir, output_csv, cache_file, cli_args.workers, cli_args.resume, cli_args.events, cli_args.events_file, 
+			                       cli_args.notebooks)
 	else: 
 		repo_dir   = '/Users/arahman/FSE2021_ML_REPOS/GITHUB_REPOS/'
 		output_csv = '/Users/arahman/Documents/OneDriveWingUp/OneDrive-TennesseeTechUniversity/Research/VulnStrategyMining/ForensicsinML/Output/V5_OUTPUT_GITHUB.csv'
-		full_dict  = runFameML(repo_dir, output_csv)
+		cache_file = '/Users/arahman/Documents/OneDriveWingUp/OneDrive-TennesseeTechUniversity/Research/VulnStrategyMining/ForensicsinML/Output/V5_FACT_CACHE.sqlite'
+		full_dict  = runFameML(repo_dir, output_csv, cache_file, cli_args.workers, cli_args.resume, cli_args.events, cli_args.events_file, 
+		                       cli_args.notebooks)
 
 		# repo_dir   = '/Users/arahman/FSE2021_ML_REPOS/GITLAB_REPOS/'
 		# output_csv = '/Users/arahman/Documents/OneDriveWingUp/OneDrive-TennesseeTechUniversity/Research/VulnStrategyMining/ForensicsinML/Output/V5_OUTPUT_GITLAB.csv'
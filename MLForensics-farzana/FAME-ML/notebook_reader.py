@@ -0,0 +1,236 @@
+'''
+Streaming reader for Jupyter notebooks
+Pulls the sources of the code cells out of a .ipynb file one chunk at a time ... outputs, base64 images and
+markdown cells are stepped over without being decoded or kept, so a notebook costs about as much memory as its code
+'''
+
+import json
+import re
+
+# no project imports, mining/mining.py loads this file by path next to its own constants module
+NOTEBOOK_CHUNK_SIZE         = 256 * 1024 
+NOTEBOOK_SCALAR_MAX         = 64 
+NOTEBOOK_CELLS_KW           = 'cells'
+NOTEBOOK_WORKSHEETS_KW      = 'worksheets'
+NOTEBOOK_CELL_TYPE_KW       = 'cell_type'
+NOTEBOOK_SOURCE_KWS         = ( 'source', 'input' )
+NOTEBOOK_CODE_CELL          = 'code'
+NOTEBOOK_MAGIC_PREFIXES     = ( '%', '!' )
+NOTEBOOK_CELL_MAGIC_PREFIX  = '%%'
+NOTEBOOK_MAGIC_COMMENT      = '# '
+NOTEBOOK_ERROR_STR          = 'Not a notebook, unexpected JSON near {!r}'
+NOTEBOOK_ENCODING           = 'utf-8'
+EMPTY_STRING                = ''
+NEWLINE_KW                  = '\n'
+
+WHITESPACE_REGEX  = re.compile( r'[ \t\n\r]*' )
+# anything inside a skipped container that cannot open or close a string or a nested container
+SKIP_BODY_REGEX   = re.compile( r'[^"\[\]{}]*' )
+SCALAR_REGEX      = re.compile( r'[-+.\w]*' )
+
+
+class NotebookReader:
+    def __init__( self, file_, chunk_size=NOTEBOOK_CHUNK_SIZE ):
+        self.file_      = file_
+        self.chunk_size = chunk_size
+        self.buf_       = EMPTY_STRING
+        self.pos_       = 0
+
+    def fill( self ):
+        '''
+        drops the consumed part of the buffer and appends the next chunk, False once the file is exhausted
+        '''
+        chunk_ = self.file_.read( self.chunk_size )
+        if not chunk_:
+            return False
+        self.buf_ = self.buf_[self.pos_:] + chunk_
+        self.pos_ = 0
+        return True
+
+    def fail( self ):
+        raise ValueError( NOTEBOOK_ERROR_STR.format( self.buf_[self.pos_:self.pos_ + 20] ) )
+
+    def peek( self ):
+        '''
+        next non blank character, not consumed
+        '''
+        while True:
+            self.pos_ = WHITESPACE_REGEX.match( self.buf_, self.pos_ ).end()
+            if self.pos_ < len( self.buf_ ):
+                return self.buf_[self.pos_]
+            if not self.fill():
+                self.fail()
+
+    def expect( self, char_ ):
+        if self.peek() != char_:
+            self.fail()
+        self.pos_ += 1
+
+    def findStringEnd( self ):
+        '''
+        index of the quote that closes the string the cursor is in, -1 if it is not in the buffer yet ... a quote 
+        closes the string unless an odd run of backslashes escapes it
+        '''
+        quote_pos = self.buf_.find( '"', self.pos_ )
+        while quote_pos != -1:
+            slash_pos = quote_pos
+            while slash_pos > self.pos_ and self.buf_[slash_pos - 1] == '\\':
+                slash_pos -= 1
+            if ( quote_pos - slash_pos ) % 2 == 0:
+                return quote_pos
+            quote_pos = self.buf_.find( '"', quote_pos + 1 )
+        return -1
+
+    def readString( self, keep=True ):
+        '''
+        decoded string at the cursor, or None with keep=False, in which case nothing of it is held past a chunk
+        '''
+        self.expect( '"' )
+        part_list = []
+        while True:
+            end_ = self.findStringEnd()
+            if end_ != -1:
+                break
+            # a backslash run at the end of the buffer may escape the first character of the next chunk
+            end_ = len( self.buf_ )
+            while end_ > self.pos_ and self.buf_[end_ - 1] == '\\':
+                end_ -= 1
+            if keep:
+                part_list.append( self.buf_[self.pos_:end_] )
+            self.pos_ = end_
+            if not self.fill():
+                self.fail()
+        if keep:
+            part_list.append( self.buf_[self.pos_:end_] )
+        self.pos_ = end_ + 1
+        if not keep:
+            return None
+        return json.loads( '"' + EMPTY_STRING.join( part_list ) + '"', strict=False )
+
+    def skipValue( self ):
+        char_ = self.peek()
+        if char_ == '"':
+            self.readString( keep=False )
+        elif char_ in '[{':
+            depth_ = 0
+            while True:
+                self.pos_ = SKIP_BODY_REGEX.match( self.buf_, self.pos_ ).end()
+                if self.pos_ >= len( self.buf_ ):
+                    if not self.fill():
+                        self.fail()
+                    continue
+                char_ = self.buf_[self.pos_]
+                if char_ == '"':
+                    self.readString( keep=False )
+                    continue
+                self.pos_ += 1
+                depth_ += 1 if char_ in '[{' else -1
+                if depth_ == 0:
+                    break
+        else:
+            # a number, true, false or null ... refill first so the scalar is not cut at the chunk border
+            while len( self.buf_ ) - self.pos_ < NOTEBOOK_SCALAR_MAX and self.fill():
+                pass
+            end_ = SCALAR_REGEX.match( self.buf_, self.pos_ ).end()
+            if end_ == self.pos_:
+                self.fail()
+            self.pos_ = end_
+
+    def iterItems( self ):
+        '''
+        yields once per array element with the cursor on it, the caller reads or skips the element
+        '''
+        self.expect( '[' )
+        if self.peek() == ']':
+            self.pos_ += 1
+            return
+        while True:
+            yield
+            char_ = self.peek()
+            self.pos_ += 1
+            if char_ == ']':
+                return
+            if char_ != ',':
+                self.pos_ -= 1
+                self.fail()
+
+    def iterKeys( self ):
+        '''
+        yields the keys of an object with the cursor on their value, the caller reads or skips the value
+        '''
+        self.expect( '{' )
+        if self.peek() == '}':
+            self.pos_ += 1
+            return
+        while True:
+            key_ = self.readString()
+            self.expect( ':' )
+            yield key_
+            char_ = self.peek()
+            self.pos_ += 1
+            if char_ == '}':
+                return
+            if char_ != ',':
+                self.pos_ -= 1
+                self.fail()
+
+    def readSource( self ):
+        '''
+        cell sources are a list of lines in nbformat 4, older writers also used a single string
+        '''
+        if self.peek() == '"':
+            return self.readString()
+        return EMPTY_STRING.join( self.readString() for _ in self.iterItems() )
+
+    def iterCells( self ):
+        for _ in self.iterItems():
+            cell_type, cell_source = None, None
+            for key_ in self.iterKeys():
+                if key_ == NOTEBOOK_CELL_TYPE_KW:
+                    cell_type = self.readString()
+                elif key_ in NOTEBOOK_SOURCE_KWS:
+                    cell_source = self.readSource()
+                else:
+                    self.skipValue()
+            if cell_type == NOTEBOOK_CODE_CELL and cell_source is not None:
+                yield cell_source
+
+    def iterCodeCells( self ):
+        '''
+        sources of the code cells in notebook order, nbformat 3 keeps its cells in worksheets
+        '''
+        for key_ in self.iterKeys():
+            if key_ == NOTEBOOK_CELLS_KW:
+                yield from self.iterCells()
+            elif key_ == NOTEBOOK_WORKSHEETS_KW:
+                for _ in self.iterItems():
+                    for sheet_key in self.iterKeys():
+                        if sheet_key == NOTEBOOK_CELLS_KW:
+                            yield from self.iterCells()
+                        else:
+                            self.skipValue()
+            else:
+                self.skipValue()
+
+
+def getCellLines( cell_source ):
+    '''
+    IPython magics and shell escapes are not Python, they are kept as comments so that line numbers do not move ...
+    a cell magic such as %%bash turns the whole cell into another language
+    '''
+    line_list = cell_source.split( NEWLINE_KW )
+    cell_magic = cell_source.lstrip().startswith( NOTEBOOK_CELL_MAGIC_PREFIX )
+    return [ NOTEBOOK_MAGIC_COMMENT + code_line if cell_magic or code_line.lstrip().startswith( NOTEBOOK_MAGIC_PREFIXES ) \
+             else code_line for code_line in line_list ]
+
+
+def getNotebookSource( nb_file ):
+    '''
+    code cells of nb_file as one Python source, one cell after the other ... raises ValueError if nb_file is not a
+    notebook
+    '''
+    line_list = []
+    with open( nb_file, 'r', encoding=NOTEBOOK_ENCODING ) as file_:
+        for cell_source in NotebookReader( file_ ).iterCodeCells():
+            line_list.extend( getCellLines( cell_source ) )
+    return NEWLINE_KW.join( line_list ) + NEWLINE_KW
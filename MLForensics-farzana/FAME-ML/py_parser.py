@@ -8,36 +8,46 @@ Parser needed to implement FAME-ML
 import ast 
 import os 
 import constants 
+import notebook_reader 
+from collections import OrderedDict 
+
+# parse trees keyed by (path, mtime, size), least recently used first 
+PARSE_CACHE = OrderedDict()
+PARSE_CACHE_STATS = { constants.CACHE_HITS_KW: 0, constants.CACHE_MISSES_KW: 0, constants.CACHE_MAX_SIZE_KW: constants.PARSE_CACHE_MAX_SIZE }
 
 
 def checkLoggingPerData(tree_object, name2track):
     '''
     Check if data used in any load/write methods is logged ... called once for one load/write operation 
     '''
-    LOGGING_EXISTS_FLAG = False 
-    IMPORT_FLAG, FUNC_FLAG, ARG_FLAG  = False, False , False 
-    for stmt_ in tree_object.body:
-        for node_ in ast.walk(stmt_):
-            if isinstance(node_, ast.Import) :
-                funcDict = node_.__dict__     
-                # print(funcDict) 
-                import_name_objects = funcDict[constants.NAMES_KW]
-                for obj in import_name_objects:
-                    if ( constants.LOGGING_KW in  obj.__dict__[constants.NAME_KW]): 
-                        IMPORT_FLAG = True 
-    func_decl_list = getPythonAtrributeFuncs(tree_object)
-    for func_decl_ in func_decl_list:
-        func_parent_id, func_name , funcLineNo, call_arg_list = func_decl_ # the class in which the method belongs, func_name, line no, arg_list 
-        
-        if ( constants.LOGGING_KW in func_parent_id ) or ( constants.LOGGING_KW in func_name) : 
-            # print(func_parent_id, func_name, call_arg_list)  
-            FUNC_FLAG = True 
-            for arg_ in call_arg_list:
-                if name2track in arg_:
-                    ARG_FLAG = True 
-    if (IMPORT_FLAG) and (FUNC_FLAG) and (ARG_FLAG):
-        LOGGING_EXISTS_FLAG = True 
-    return LOGGING_EXISTS_FLAG 
+    return checkLoggingPerFacts( getFileFacts( tree_object ), name2track ) 
+
+
+def checkLoggingPerFacts(file_facts, name2track):
+    '''
+    Same as checkLoggingPerData() but uses the fact tables from getFileFacts() instead of walking the tree 
+    '''
+    return ( name2track in getLoggedNames( file_facts ) ) 
+
+
+def getLoggedNames(file_facts):
+    '''
+    Names passed to any logging call of the file, empty if logging is never imported ... computed once per file 
+    so every event can be checked against it 
+    '''
+    logged_names = set() 
+    IMPORT_FLAG = False 
+    for import_name in file_facts[constants.FACT_IMPORT_NAMES_KW]:
+        if ( constants.LOGGING_KW in import_name ): 
+            IMPORT_FLAG = True 
+    if IMPORT_FLAG:
+        func_decl_list = file_facts[constants.FACT_ATTRIB_CALLS_KW]
+        for func_decl_ in func_decl_list:
+            func_parent_id, func_name , funcLineNo, call_arg_list = func_decl_ # the class in which the method belongs, func_name, line no, arg_list 
+            if ( constants.LOGGING_KW in func_parent_id ) or ( constants.LOGGING_KW in func_name) : 
+                for arg_ in call_arg_list:
+                    logged_names.update( arg_name for arg_name in arg_ if isinstance( arg_name, str ) ) 
+    return logged_names 
 
 
 def func_def_log_check(func_decl_list):
@@ -77,10 +87,66 @@ def checkAttribFuncsInExcept(expr_obj):
                 attrib_list = attrib_list + commonAttribCallBody( func_node )
     return attrib_list 
 
+def getParseCacheKey( pyFile ):
+	'''
+	a file is re-parsed only if its path, modification time or size changed 
+	'''
+	stat_ = os.stat( pyFile )
+	return ( pyFile, stat_.st_mtime_ns, stat_.st_size ) 
+
+
+def parsePythonFile( pyFile ):
+	'''
+	parses pyFile through the LRU parse cache ... parsing errors are raised to the caller and not cached, a notebook 
+	is parsed from the sources of its code cells, ValueError if it is not one 
+	'''
+	cache_key = getParseCacheKey( pyFile )
+	if cache_key in PARSE_CACHE:
+		PARSE_CACHE.move_to_end( cache_key )
+		PARSE_CACHE_STATS[constants.CACHE_HITS_KW] += 1 
+		return PARSE_CACHE[cache_key]
+	PARSE_CACHE_STATS[constants.CACHE_MISSES_KW] += 1 
+	if pyFile.endswith( constants.NOTEBOOK_FILE_EXTENSION ):
+		full_tree = ast.parse( notebook_reader.getNotebookSource( pyFile ) )
+	else:
+		with open( pyFile ) as file_:
+			full_tree = ast.parse( file_.read() )
+	PARSE_CACHE[cache_key] = full_tree 
+	while len( PARSE_CACHE ) > PARSE_CACHE_STATS[constants.CACHE_MAX_SIZE_KW]:
+		PARSE_CACHE.popitem( last=False )
+	return full_tree 
+
+
+def getParseCacheStats():
+	stats_ = dict( PARSE_CACHE_STATS )
+	stats_[constants.CACHE_SIZE_KW] = len( PARSE_CACHE )
+	return stats_ 
+
+
+def addParseCacheStats( hits_, misses_ ):
+	'''
+	books lookups made by the caches of pool workers, so that the run summary covers them 
+	'''
+	PARSE_CACHE_STATS[constants.CACHE_HITS_KW]   += hits_ 
+	PARSE_CACHE_STATS[constants.CACHE_MISSES_KW] += misses_ 
+
+
+def setParseCacheSize( max_size ):
+	PARSE_CACHE_STATS[constants.CACHE_MAX_SIZE_KW] = max_size 
+	while len( PARSE_CACHE ) > max_size:
+		PARSE_CACHE.popitem( last=False )
+
+
+def clearParseCache():
+	PARSE_CACHE.clear()
+	PARSE_CACHE_STATS[constants.CACHE_HITS_KW]   = 0 
+	PARSE_CACHE_STATS[constants.CACHE_MISSES_KW] = 0 
+
+
 def getPythonParseObject( pyFile ): 
 	try:
-		full_tree = ast.parse( open( pyFile ).read())    
-	except SyntaxError:
+		full_tree = parsePythonFile( pyFile )
+	except (SyntaxError, ValueError):
 		# print(constants.PARSING_ERROR_KW, pyFile )
 		full_tree = ast.parse(constants.EMPTY_STRING) 
 	return full_tree 
@@ -183,254 +249,368 @@ def getPythonAtrributeFuncs(pyTree):
     return attrib_call_list 
     
     
+def getFunctionAssignmentBody(node_):
+    '''
+    handles one assignment like lhs = funcName() or lhs = class.funcName() 
+    '''
+    call_list = []
+    lhs = ''
+    assign_dict = node_.__dict__
+    targets, value  =  assign_dict[ constants.TARGETS_KW ], assign_dict[ constants.VALUE_KW ]
+    if isinstance(value, ast.Call):
+        funcDict = value.__dict__ 
+        funcName, funcArgs, funcLineNo, funcKeys =  funcDict[ constants.FUNC_KW ], funcDict[ constants.ARGS_KW ], funcDict[constants.LINE_NO_KW], funcDict[constants.KEY_WORDS_KW]  
+        for target in targets:
+            if( isinstance(target, ast.Name) ):
+                lhs = target.id 
+        if( isinstance(funcName, ast.Name ) ): 
+            call_arg_list = [] 
+            index = 0   
+            for x_ in range(len(funcArgs)):
+                index = x_ + 1
+                funcArg = funcArgs[x_] 
+                if( isinstance(funcArg, ast.Name ) ):
+                    call_arg_list.append( ( funcArg.id, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
+                elif(isinstance( funcArg, ast.Str ) ):
+                    call_arg_list.append( ( funcArg.s, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
+                    
+            for x_ in range(len(funcKeys)):
+                funcKey = funcKeys[x_] 
+                if( isinstance(funcKey, ast.keyword ) )  :
+                    call_arg_list.append( (  funcKey.arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1 + index) )  ) 
+                    
+            call_list.append( ( lhs, funcName.id, funcLineNo, call_arg_list )  )	
+            
+        elif( isinstance( funcName, ast.Attribute ) ):
+            call_arg_list = []   
+            index = 0       
+            func_name_dict  = funcName.__dict__
+            func_name = func_name_dict[constants.ATTRIB_KW] 
+            for x_ in range(len(funcArgs)):
+                index = x_ + 1
+                funcArg = funcArgs[x_] 
+                if( isinstance( funcArg, ast.Call ) ):
+                    func_arg_dict  = funcArg.__dict__
+                    func_arg = func_arg_dict[constants.FUNC_KW] 
+                    call_arg_list.append( ( func_arg,  constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
+                elif( isinstance(funcArg, ast.Attribute) ): 
+                    func_arg_dic  = funcArg.__dict__
+                    func_arg = func_arg_dic[constants.ATTRIB_KW] 
+                    call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
+                elif(isinstance( funcArg, ast.Str ) ):
+                    call_arg_list.append( ( funcArg.s, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
+                elif isinstance(funcArg, ast.Subscript):
+                    func_arg =  funcArg.value
+                    if isinstance(func_arg, ast.Name):
+                        func_arg = func_arg.id 
+                    elif isinstance(func_arg, ast.Subscript):
+                        func_arg = func_arg.value 
+                        call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
+                        
+            for x_ in range(len(funcKeys)):
+                funcKey = funcKeys[x_] 
+                if( isinstance(funcKey, ast.keyword ) )  :
+                    call_arg_list.append( (  funcKey.arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1 + index) )  ) 
+                    
+            call_list.append( ( lhs, func_name, funcLineNo, call_arg_list )  )
+    return call_list 
+
+
 def getFunctionAssignments(pyTree):
     call_list = []
     for stmt_ in pyTree.body:
         for node_ in ast.walk(stmt_):
             if isinstance(node_, ast.Assign):
-            	lhs = ''
-            	assign_dict = node_.__dict__
-            	targets, value  =  assign_dict[ constants.TARGETS_KW ], assign_dict[ constants.VALUE_KW ]
-            	if isinstance(value, ast.Call):
-                    funcDict = value.__dict__ 
-                    funcName, funcArgs, funcLineNo, funcKeys =  funcDict[ constants.FUNC_KW ], funcDict[ constants.ARGS_KW ], funcDict[constants.LINE_NO_KW], funcDict[constants.KEY_WORDS_KW]  
-                    for target in targets:
-                    	if( isinstance(target, ast.Name) ):
-                            lhs = target.id 
-                    if( isinstance(funcName, ast.Name ) ): 
-                    	call_arg_list = [] 
-                    	index = 0   
-                    	      
-                    	for x_ in range(len(funcArgs)):
-                    		index = x_ + 1
-                    		funcArg = funcArgs[x_] 
-                    		if( isinstance(funcArg, ast.Name ) ):
-                        		call_arg_list.append( ( funcArg.id, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
-                    		elif(isinstance( funcArg, ast.Str ) ):
-                        		call_arg_list.append( ( funcArg.s, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
-                        		
-                    	for x_ in range(len(funcKeys)):
-                    		funcKey = funcKeys[x_] 
-                    		if( isinstance(funcKey, ast.keyword ) )  :
-                    			call_arg_list.append( (  funcKey.arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1 + index) )  ) 
-        					
-                    	call_list.append( ( lhs, funcName.id, funcLineNo, call_arg_list )  )	
-                    	
-                    elif( isinstance( funcName, ast.Attribute ) ):
-                    	call_arg_list = []   
-                    	index = 0       
-                    	func_name_dict  = funcName.__dict__
-                    	func_name = func_name_dict[constants.ATTRIB_KW] 
-                    	for x_ in range(len(funcArgs)):
-                    		index = x_ + 1
-                    		funcArg = funcArgs[x_] 
-                    		if( isinstance( funcArg, ast.Call ) ):
-                        		func_arg_dict  = funcArg.__dict__
-                        		func_arg = func_arg_dict[constants.FUNC_KW] 
-                        		call_arg_list.append( ( func_arg,  constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
-                    		elif( isinstance(funcArg, ast.Attribute) ): 
-                    			func_arg_dic  = funcArg.__dict__
-                    			func_arg = func_arg_dic[constants.ATTRIB_KW] 
-                    			call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
-                    		elif(isinstance( funcArg, ast.Str ) ):
-                        		call_arg_list.append( ( funcArg.s, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
-                    		elif isinstance(funcArg, ast.Subscript):
-                    			func_arg =  funcArg.value
-                    			if isinstance(func_arg, ast.Name):
-                    				func_arg = func_arg.id 
-                    			elif isinstance(func_arg, ast.Subscript):
-                    				func_arg = func_arg.value 
-                    				call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
-                    				
-                    	for x_ in range(len(funcKeys)):
-                    		funcKey = funcKeys[x_] 
-                    		if( isinstance(funcKey, ast.keyword ) )  :
-                    			call_arg_list.append( (  funcKey.arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1 + index) )  ) 
-        						
-                    	call_list.append( ( lhs, func_name, funcLineNo, call_arg_list )  )
+                call_list = call_list + getFunctionAssignmentBody( node_ )
 
     return call_list 
     
     
+def getFunctionDefinitionBody(node_):
+    '''
+    handles one call like funcName() 
+    '''
+    func_list = []
+    funcDict = node_.__dict__ 
+    func_, funcArgs, funcLineNo, funcKeys =  funcDict[ constants.FUNC_KW ], funcDict[constants.ARGS_KW], funcDict[constants.LINE_NO_KW], funcDict[constants.KEY_WORDS_KW] 
+    if( isinstance(func_, ast.Name ) ):  
+        func_name = func_.id 
+        call_arg_list = []
+        index = 0                
+        for x_ in range(len(funcArgs)):
+            index = x_ + 1
+            funcArg = funcArgs[x_] 
+            if( isinstance(funcArg, ast.Name ) )  :
+                call_arg_list.append( (  funcArg.id, constants.INDEX_KW + str(x_ + 1) )  ) 
+            elif( isinstance(funcArg, ast.Attribute) ): 
+                arg_dic  = funcArg.__dict__
+                arg_name = arg_dic[constants.ATTRIB_KW] 
+                call_arg_list.append( (  arg_name, constants.INDEX_KW + str(x_ + 1) )  ) 
+            elif( isinstance( funcArg, ast.Call ) ):
+                func_arg_dict  = funcArg.__dict__
+                func_arg = func_arg_dict[constants.FUNC_KW] 
+                call_arg_list.append( ( func_arg, constants.INDEX_KW + str( x_ + 1 )  ) )
+            elif( isinstance( funcArg, ast.Str ) ):
+                call_arg_list.append( ( funcArg.s, constants.INDEX_KW + str( x_ + 1 )  ) )
+                
+        for x_ in range(len(funcKeys)):
+            funcKey = funcKeys[x_] 
+            if( isinstance(funcKey, ast.keyword ) )  :
+                call_arg_list.append( (  funcKey.arg, constants.INDEX_KW + str(x_ + index + 1) )  ) 
+        func_list.append( ( func_name , funcLineNo, call_arg_list  ) )        
+    return func_list
+
+
 def getFunctionDefinitions(pyTree):
     func_list = []
-    func_var_list = []
     for stmt_ in pyTree.body:
         for node_ in ast.walk(stmt_):
-        	if isinstance(node_, ast.Call):
-        		funcDict = node_.__dict__ 
-        		func_, funcArgs, funcLineNo, funcKeys =  funcDict[ constants.FUNC_KW ], funcDict[constants.ARGS_KW], funcDict[constants.LINE_NO_KW], funcDict[constants.KEY_WORDS_KW] 
-        		if( isinstance(func_, ast.Name ) ):  
-        			func_name = func_.id 
-        			call_arg_list = []
-        			index = 0                
-        			for x_ in range(len(funcArgs)):
-        				index = x_ + 1
-        				funcArg = funcArgs[x_] 
-        				if( isinstance(funcArg, ast.Name ) )  :
-        					call_arg_list.append( (  funcArg.id, constants.INDEX_KW + str(x_ + 1) )  ) 
-        				elif( isinstance(funcArg, ast.Attribute) ): 
-        					arg_dic  = funcArg.__dict__
-        					arg_name = arg_dic[constants.ATTRIB_KW] 
-        					call_arg_list.append( (  arg_name, constants.INDEX_KW + str(x_ + 1) )  ) 
-        				elif( isinstance( funcArg, ast.Call ) ):
-        					func_arg_dict  = funcArg.__dict__
-        					func_arg = func_arg_dict[constants.FUNC_KW] 
-        					call_arg_list.append( ( func_arg, constants.INDEX_KW + str( x_ + 1 )  ) )
-        				elif( isinstance( funcArg, ast.Str ) ):
-        					call_arg_list.append( ( funcArg.s, constants.INDEX_KW + str( x_ + 1 )  ) )
-        					
-        			for x_ in range(len(funcKeys)):
-        				funcKey = funcKeys[x_] 
-        				if( isinstance(funcKey, ast.keyword ) )  :
-        					call_arg_list.append( (  funcKey.arg, constants.INDEX_KW + str(x_ + index + 1) )  ) 
-        			func_list.append( ( func_name , funcLineNo, call_arg_list  ) )        
-        			         
+            if isinstance(node_, ast.Call):
+                func_list = func_list + getFunctionDefinitionBody( node_ )
+                
     return func_list
 
     
-    
+def getFunctionAssignmentWithMultipleLHSBody(node_):
+    '''
+    handles one assignment like lhs1, lhs2 = funcName() or lhs1, lhs2 = class.funcName() 
+    '''
+    call_list = []
+    lhs = []
+    assign_dict = node_.__dict__
+    targets, value  =  assign_dict[  constants.TARGETS_KW ], assign_dict[  constants.VALUE_KW ]
+    if isinstance(value, ast.Call):
+        funcDict = value.__dict__ 
+        funcName, funcArgs, funcLineNo =  funcDict[ constants.FUNC_KW ], funcDict[ constants.ARGS_KW ], funcDict[constants.LINE_NO_KW] 
+        for target in targets:
+            if( isinstance(target, ast.Name) ):
+                lhs.append(target.id) 
+            elif( isinstance(target, ast.Tuple) ):
+                for item in target.elts:
+                    if isinstance(item, ast.Name):
+                        lhs.append(item.id)
+        if( isinstance(funcName, ast.Name ) ): 
+            call_arg_list = []       
+            for x_ in range(len(funcArgs)):
+                funcArg = funcArgs[x_] 
+                if( isinstance(funcArg, ast.Name ) ):
+                    call_arg_list.append( ( funcArg.id, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )             
+                elif( isinstance( funcArg, ast.Str ) ):
+                    call_arg_list.append( ( funcArg.s, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
+                elif( isinstance( funcArg, ast.Call ) ):
+                    func_arg_dict  = funcArg.__dict__
+                    func_arg = func_arg_dict[constants.FUNC_KW] 
+                    call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
+                elif( isinstance( funcArg, ast.Attribute ) ): 
+                    func_arg_dic  = funcArg.__dict__
+                    func_arg = func_arg_dic[constants.ATTRIB_KW] 
+                    call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) ) 
+            call_list.append( ( lhs, funcName.id, funcLineNo, call_arg_list )  )	
+        elif( isinstance( funcName, ast.Attribute ) ):
+            call_arg_list = []       
+            func_name_dict  = funcName.__dict__
+            func_name = func_name_dict[constants.ATTRIB_KW] 
+            for x_ in range(len(funcArgs)):
+                funcArg = funcArgs[x_] 
+                if( isinstance(funcArg, ast.Name ) ):
+                    call_arg_list.append( ( funcArg.id, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
+                elif(isinstance( funcArg, ast.Str ) ):
+                    call_arg_list.append( ( funcArg.s, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
+                elif( isinstance( funcArg, ast.Call ) ):
+                    func_arg_dict  = funcArg.__dict__
+                    func_arg = func_arg_dict[constants.FUNC_KW] 
+                    call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
+                elif( isinstance(funcArg, ast.Attribute) ): 
+                    func_arg_dic  = funcArg.__dict__
+                    func_arg = func_arg_dic[constants.ATTRIB_KW] 
+                    call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) )   ) 
+            call_list.append( ( lhs, func_name, funcLineNo, call_arg_list )  )
+    return call_list 
+
+
 def getFunctionAssignmentsWithMultipleLHS(pyTree):
     call_list = []
     for stmt_ in pyTree.body:
         for node_ in ast.walk(stmt_):
             if isinstance(node_, ast.Assign):
-            	lhs = []
-            	assign_dict = node_.__dict__
-            	targets, value  =  assign_dict[  constants.TARGETS_KW ], assign_dict[  constants.VALUE_KW ]
-            	if isinstance(value, ast.Call):
-                    funcDict = value.__dict__ 
-                    funcName, funcArgs, funcLineNo =  funcDict[ constants.FUNC_KW ], funcDict[ constants.ARGS_KW ], funcDict[constants.LINE_NO_KW] 
-                    for target in targets:
-                    	if( isinstance(target, ast.Name) ):
-                            lhs.append(target.id) 
-                    	elif( isinstance(target, ast.Tuple) ):
-                    		for item in target.elts:
-                    			if isinstance(item, ast.Name):
-                    				lhs.append(item.id)
-                    if( isinstance(funcName, ast.Name ) ): 
-                    	call_arg_list = []       
-                    	for x_ in range(len(funcArgs)):
-                    		funcArg = funcArgs[x_] 
-                    		if( isinstance(funcArg, ast.Name ) ):
-                    			call_arg_list.append( ( funcArg.id, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )             
-                    		elif( isinstance( funcArg, ast.Str ) ):
-                    			call_arg_list.append( ( funcArg.s, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
-                    		elif( isinstance( funcArg, ast.Call ) ):
-                    			func_arg_dict  = funcArg.__dict__
-                    			func_arg = func_arg_dict[constants.FUNC_KW] 
-                    			call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
-                    		elif( isinstance( funcArg, ast.Attribute ) ): 
-                    			func_arg_dic  = funcArg.__dict__
-                    			func_arg = func_arg_dic[constants.ATTRIB_KW] 
-                    			call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) ) 
-                    	call_list.append( ( lhs, funcName.id, funcLineNo, call_arg_list )  )	
-                    elif( isinstance( funcName, ast.Attribute ) ):
-                    	call_arg_list = []       
-                    	func_name_dict  = funcName.__dict__
-                    	func_name = func_name_dict[constants.ATTRIB_KW] 
-                    	for x_ in range(len(funcArgs)):
-                    		funcArg = funcArgs[x_] 
-                    		if( isinstance(funcArg, ast.Name ) ):
-                        		call_arg_list.append( ( funcArg.id, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
-                    		elif(isinstance( funcArg, ast.Str ) ):
-                        		call_arg_list.append( ( funcArg.s, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
-                    		elif( isinstance( funcArg, ast.Call ) ):
-                        		func_arg_dict  = funcArg.__dict__
-                        		func_arg = func_arg_dict[constants.FUNC_KW] 
-                        		call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) ) )
-                    		elif( isinstance(funcArg, ast.Attribute) ): 
-                    			func_arg_dic  = funcArg.__dict__
-                    			func_arg = func_arg_dic[constants.ATTRIB_KW] 
-                    			call_arg_list.append( ( func_arg, constants.FUNC_CALL_ARG_STR + str(x_ + 1) )   ) 
-                    	call_list.append( ( lhs, func_name, funcLineNo, call_arg_list )  )
+                call_list = call_list + getFunctionAssignmentWithMultipleLHSBody( node_ )
 
     return call_list 
     
 
+def getModelFeatureBody(node_):
+    '''
+    handles one assignment like lhs = class.feature or lhs = class.feature[index] 
+    '''
+    feature_list = []
+    lhs = ''
+    assign_dict = node_.__dict__
+    targets, value  =  assign_dict[  constants.TARGETS_KW ], assign_dict[  constants.VALUE_KW ]
+    if isinstance(value, ast.Attribute):
+        funcDict = value.__dict__ 
+        className, featureName, funcLineNo =  funcDict[ constants.VALUE_KW ], funcDict[ constants.ATTRIB_KW ], funcDict[ constants.LINE_NO_KW ] 
+        for target in targets:
+            if( isinstance(target, ast.Name) ):
+                lhs = target.id 
+        if( isinstance(className, ast.Name ) ): 
+            feature_list.append( ( lhs, className.id, featureName, funcLineNo)  )	
+    if isinstance(value, ast.Subscript):
+        value =  value.value
+        if isinstance(value, ast.Attribute):
+            funcDict = value.__dict__ 
+            className, featureName, funcLineNo =  funcDict[ constants.VALUE_KW ], funcDict[ constants.ATTRIB_KW ], funcDict[constants.LINE_NO_KW] 
+            for target in targets:
+                if( isinstance(target, ast.Name) ):
+                    lhs = target.id 
+            if( isinstance(className, ast.Name ) ): 
+                feature_list.append( ( lhs, className.id, featureName, funcLineNo)  )
+            elif( isinstance(className, ast.Attribute ) ): 
+                class_dic  = className.__dict__
+                class_name = class_dic[constants.ATTRIB_KW] 
+                feature_list.append( ( lhs, class_name, featureName, funcLineNo)  )	
+    return feature_list 
+
+
 def getModelFeature(pyTree):
     feature_list = []
     for stmt_ in pyTree.body:
         for node_ in ast.walk(stmt_):
             if isinstance(node_, ast.Assign):
-            	lhs = ''
-            	assign_dict = node_.__dict__
-            	targets, value  =  assign_dict[  constants.TARGETS_KW ], assign_dict[  constants.VALUE_KW ]
-            	if isinstance(value, ast.Attribute):
-                    funcDict = value.__dict__ 
-                    className, featureName, funcLineNo =  funcDict[ constants.VALUE_KW ], funcDict[ constants.ATTRIB_KW ], funcDict[ constants.LINE_NO_KW ] 
-                    for target in targets:
-                    	if( isinstance(target, ast.Name) ):
-                            lhs = target.id 
-                    if( isinstance(className, ast.Name ) ): 
-                    	feature_list.append( ( lhs, className.id, featureName, funcLineNo)  )	
-            	if isinstance(value, ast.Subscript):
-                	value =  value.value
-                	if isinstance(value, ast.Attribute):
-                		funcDict = value.__dict__ 
-                		className, featureName, funcLineNo =  funcDict[ constants.VALUE_KW ], funcDict[ constants.ATTRIB_KW ], funcDict[constants.LINE_NO_KW] 
-                		for target in targets:
-                			if( isinstance(target, ast.Name) ):
-                				lhs = target.id 
-                		if( isinstance(className, ast.Name ) ): 
-                			feature_list.append( ( lhs, className.id, featureName, funcLineNo)  )
-                		elif( isinstance(className, ast.Attribute ) ): 
-                			class_dic  = className.__dict__
-                			class_name = class_dic[constants.ATTRIB_KW] 
-                			feature_list.append( ( lhs, class_name, featureName, funcLineNo)  )	
+                feature_list = feature_list + getModelFeatureBody( node_ )
 
     return feature_list 
     
     
+def getTupAssiBody(node_): 
+    '''
+    handles one assignment like lhs = [var for var in iter] 
+    '''
+    var_assignment_list = []
+    lhs = ''
+    assign_dict = node_.__dict__
+    targets, value  =  assign_dict[ constants.TARGETS_KW ], assign_dict[  constants.VALUE_KW ]
+    if isinstance(value, ast.ListComp):
+        varDict = value.__dict__ 
+        varName, varValue, varLineNo =  varDict[ constants.ELT_KW ], varDict[ constants.GENERATORS_KW ], varDict[ constants.LINE_NO_KW ] 
+        for target in targets:
+            if( isinstance(target, ast.Name) ):
+                lhs = target.id 
+        if isinstance(varName, ast.Subscript):
+            varName =  varName.value
+            if isinstance(varName, ast.Name):
+                varName = varName.id
+        if isinstance(varValue, list):
+            varValue =  varValue[0]
+            if isinstance(varValue, ast.comprehension):
+                varIter = varValue.iter
+                if isinstance(varIter, ast.Name):
+                    varIter = varIter.id
+                varValue = varValue.target
+                if isinstance(varValue, ast.Name):
+                    varValue = varValue.id
+        var_assignment_list.append( (lhs, varName, varValue, varIter, varLineNo) )
+    return var_assignment_list 
+
+
 def getTupAssiDetails(pyTree): 
     var_assignment_list = []
     for stmt_ in pyTree.body:
         for node_ in ast.walk(stmt_):
             if isinstance(node_, ast.Assign):
-            	lhs = ''
-            	assign_dict = node_.__dict__
-            	targets, value  =  assign_dict[ constants.TARGETS_KW ], assign_dict[  constants.VALUE_KW ]
-            	if isinstance(value, ast.ListComp):
-                    varDict = value.__dict__ 
-                    varName, varValue, varLineNo =  varDict[ constants.ELT_KW ], varDict[ constants.GENERATORS_KW ], varDict[ constants.LINE_NO_KW ] 
-                    for target in targets:
-                    	if( isinstance(target, ast.Name) ):
-                            lhs = target.id 
-                    if isinstance(varName, ast.Subscript):
-                    	varName =  varName.value
-                    	if isinstance(varName, ast.Name):
-                    		varName = varName.id
-                    if isinstance(varValue, list):
-                    	varValue =  varValue[0]
-                    	if isinstance(varValue, ast.comprehension):
-                    		varIter = varValue.iter
-                    		if isinstance(varIter, ast.Name):
-                    			varIter = varIter.id
-                    		varValue = varValue.target
-                    		if isinstance(varValue, ast.Name):
-                    			varValue = varValue.id
-                    var_assignment_list.append( (lhs, varName, varValue, varIter, varLineNo) )
+                var_assignment_list = var_assignment_list + getTupAssiBody( node_ )
 
     return var_assignment_list     
     
     
+def getImportBody(node_): 
+    import_list = []
+    if isinstance(node_, ast.Import):
+        for name in node_.names:
+            import_list.append( (name.name.split('.')[0] ) )
+    elif isinstance(node_, ast.ImportFrom):
+        if(node_.module is not None):
+            import_list.append( ( node_.module.split('.')[0] ) )
+    return import_list 
+
+
 def getImport(pyTree): 
     import_list = []
     for stmt_ in pyTree.body:
         for node_ in ast.walk(stmt_):
-        	if isinstance(node_, ast.Import):
-        		for name in node_.names:
-        			import_list.append( (name.name.split('.')[0] ) )
-        	elif isinstance(node_, ast.ImportFrom):
-        		if(node_.module is not None):
-        			import_list.append( ( node_.module.split('.')[0] ) )
+            import_list = import_list + getImportBody( node_ )
 
     return import_list 
 
-def checkIfParsablePython( pyFile ):
-	flag = True 
+
+class FactExtractor(ast.NodeVisitor):
+    '''
+    Collects every fact table needed by lint_engine in one walk of the tree. 
+    Nodes are dispatched in the same order as the ast.walk() loops above, so each table 
+    is identical to what the matching get*() function returns 
+    '''
+    def __init__(self):
+        self.facts = {
+            constants.FACT_ATTRIB_CALLS_KW       : [], 
+            constants.FACT_FUNC_CALLS_KW         : [], 
+            constants.FACT_FUNC_ASSIGNS_KW       : [], 
+            constants.FACT_MULTI_LHS_ASSIGNS_KW  : [], 
+            constants.FACT_MODEL_FEATURES_KW     : [], 
+            constants.FACT_TUPLE_ASSIGNS_KW      : [], 
+            constants.FACT_IMPORTS_KW            : [], 
+            constants.FACT_IMPORT_NAMES_KW       : [], 
+            constants.FACT_EXCEPT_BODY_KW        : [], 
+        }
+
+    def extract(self, pyTree):
+        for stmt_ in pyTree.body:
+            for node_ in ast.walk(stmt_):
+                self.visit( node_ )
+        return self.facts 
+
+    def generic_visit(self, node_):
+        # children are reached by extract(), not by recursion 
+        pass 
+
+    def visit_Call(self, node_):
+        self.facts[constants.FACT_ATTRIB_CALLS_KW].extend( commonAttribCallBody( node_ ) )
+        self.facts[constants.FACT_FUNC_CALLS_KW].extend( getFunctionDefinitionBody( node_ ) )
+
+    def visit_Assign(self, node_):
+        self.facts[constants.FACT_FUNC_ASSIGNS_KW].extend( getFunctionAssignmentBody( node_ ) )
+        self.facts[constants.FACT_MULTI_LHS_ASSIGNS_KW].extend( getFunctionAssignmentWithMultipleLHSBody( node_ ) )
+        self.facts[constants.FACT_MODEL_FEATURES_KW].extend( getModelFeatureBody( node_ ) )
+        self.facts[constants.FACT_TUPLE_ASSIGNS_KW].extend( getTupAssiBody( node_ ) )
+
+    def visit_Import(self, node_):
+        self.facts[constants.FACT_IMPORTS_KW].extend( getImportBody( node_ ) )
+        for obj in node_.names:
+            self.facts[constants.FACT_IMPORT_NAMES_KW].append( obj.name )
+
+    def visit_ImportFrom(self, node_):
+        self.facts[constants.FACT_IMPORTS_KW].extend( getImportBody( node_ ) )
+
+    def visit_ExceptHandler(self, node_):
+        # same as getPythonExcepts(): the last handler seen wins 
+        self.facts[constants.FACT_EXCEPT_BODY_KW] = node_.body 
+
+
+def getFileFacts(pyTree):
+    '''
+    single pass extraction of call, assignment, definition, import and except facts 
+    '''
+    return FactExtractor().extract( pyTree ) 
+
+def getParseTreeIfParsable( pyFile ):
+	'''
+	parse tree of pyFile, or None if it does not parse ... lets callers keep the tree instead of parsing twice 
+	'''
 	try:
-		full_tree = ast.parse( open( pyFile ).read())    
-	except (SyntaxError, UnicodeDecodeError) as err_ :
-		flag = False 
+		full_tree = parsePythonFile( pyFile )
+	except (SyntaxError, ValueError) as err_ :
+		full_tree = None 
+	return full_tree 
+
+
+def checkIfParsablePython( pyFile ):
+	flag = getParseTreeIfParsable( pyFile ) is not None 
 	return flag 	
\ No newline at end of file
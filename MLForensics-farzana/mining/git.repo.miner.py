@@ -17,6 +17,8 @@ from xml.parsers.expat import ExpatError
 import time 
 import  datetime 
 import os 
+import re 
+import concurrent.futures 
 
 def deleteRepo(dirName, type_):
     print(':::' + type_ + ':::Deleting ', dirName)
@@ -79,39 +81,99 @@ def cloneRepos(repo_list):
                 print(str_)                
             print('#'*100)
 
-def getMLStats(repo_path):
+def getMLStats(repo_path, workers=1):
+    '''
+    one ( repo, lines with any ML library, lines per keyword in ML_LIBRARY_KEYWORDS order ) row per repo under 
+    repo_path, see ML_CENSUS_HEADER ... with workers > 1 the repos are spread over a process pool, rows keep 
+    the directory order either way 
+    '''
     repo_statLs = []
     repo_count  = 0 
     all_repos = [f.path for f in os.scandir(repo_path) if f.is_dir()]
     print('REPO_COUNT:', len(all_repos) )    
-    for repo_ in all_repos:
-        repo_count += 1 
-        ml_lib_cnt = getMLLibraryUsage( repo_ ) 
-        repo_statLs.append( (repo_, ml_lib_cnt ) )
-        print(repo_count, ml_lib_cnt)
+    if workers > 1:
+        census_pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        census_iter = census_pool.map(getMLLibraryCensus, all_repos)
+    else:
+        census_pool = None 
+        census_iter = map(getMLLibraryCensus, all_repos)
+    try:
+        for census_tup in census_iter:
+            repo_count += 1 
+            repo_statLs.append( census_tup )
+            print(repo_count, census_tup[1])
+    finally:
+        if census_pool is not None:
+            census_pool.shutdown()
     return repo_statLs 
 
 
-def getMLLibraryUsage(path2dir): 
+# a line counts once if it has any of these, an earlier variant matched bare 'tf' instead of 'tf.' 
+ML_LIBRARY_KEYWORDS = ['sklearn', 'keras', 'gym.', 'pyqlearning', 'tensorflow', 'torch', 
+                       'rl_coach', 'tensorforce', 'stable_baselines', 'tf.']
+ML_CENSUS_HEADER = ['REPO', 'LIB_COUNT'] + [ x_.rstrip('.').upper() + '_COUNT' for x_ in ML_LIBRARY_KEYWORDS ]
+## one compiled matcher for all keywords, as no keyword is a prefix of another each match names one keyword 
+ML_LIBRARY_MATCHER = re.compile('|'.join(re.escape(x_) for x_ in ML_LIBRARY_KEYWORDS))
+SCAN_CHUNK_SIZE = 1024 * 1024 
+
+def countLibraryLines(file_, chunk_size=SCAN_CHUNK_SIZE):
+    '''
+    returns ( lines of file_ that mention any ML library, lines per keyword ), read chunk_size characters at a time 
+    the matcher runs over whole chunks and each hit is mapped to its line, a search restarting one character after 
+    each hit also finds keywords that overlap. Of the unfinished last line only its keywords and a tail too short 
+    to hold a whole keyword are kept, so memory stays bounded 
+    '''
+    tail_size   = max([len(x_) for x_ in ML_LIBRARY_KEYWORDS]) - 1 
+    tail_       = ''
+    line_keys   = set()
     usageCount  = 0 
+    lib_counts  = dict.fromkeys(ML_LIBRARY_KEYWORDS, 0)
+    for chunk_ in iter(lambda: file_.read(chunk_size), ''):
+        text_      = tail_ + chunk_.lower()
+        line_start = 0 ## the line line_keys belongs to starts here, or in an earlier chunk 
+        match_     = ML_LIBRARY_MATCHER.search(text_)
+        while match_ is not None:
+            line_end = text_.rfind('\n', line_start, match_.start())
+            if line_end != -1:
+                usageCount += countLineKeys(line_keys, lib_counts)
+                line_start = line_end + 1 
+            line_keys.add(match_.group())
+            match_ = ML_LIBRARY_MATCHER.search(text_, match_.start() + 1)
+        last_nl = text_.rfind('\n', line_start)
+        if last_nl != -1:
+            usageCount += countLineKeys(line_keys, lib_counts)
+            line_start = last_nl + 1 
+        tail_ = text_[line_start:][-tail_size:]
+    usageCount += countLineKeys(line_keys, lib_counts)
+    return usageCount, lib_counts 
+
+def countLineKeys(line_keys, lib_counts):
+    '''
+    books the keywords of one finished line and empties line_keys, returns 1 if the line had any 
+    '''
+    for x_ in line_keys:
+        lib_counts[x_] += 1 
+    line_hit = int(len(line_keys) > 0)
+    line_keys.clear()
+    return line_hit 
+
+def getMLLibraryCensus(path2dir):
+    usageCount  = 0 
+    lib_counts  = dict.fromkeys(ML_LIBRARY_KEYWORDS, 0)
     for root_, dirnames, filenames in os.walk(path2dir):
         for file_ in filenames:
             full_path_file = os.path.join(root_, file_) 
             if(os.path.exists(full_path_file)):
                 if (file_.endswith('py'))  :
-                    f = open(full_path_file, 'r', encoding='latin-1')
-                    fileContent  = f.read()
-                    fileContent  = fileContent.split('\n') 
-                    fileContents = [z_.lower() for z_ in fileContent if z_!='\n' ]
-                    # print(fileContent) 
-                    for fileContent in fileContents:
-                        if('sklearn' in fileContent) or ('keras' in fileContent) or ('gym.' in fileContent) or ('pyqlearning' in fileContent) or ('tensorflow' in fileContent) or ('torch' in fileContent):
-                                usageCount = usageCount + 1
-                        elif('rl_coach' in fileContent) or ('tensorforce' in fileContent) or ('stable_baselines' in fileContent) or ('tf.' in fileContent) :
-                                usageCount = usageCount + 1
-                        # elif('rl_coach' in fileContent) or ('tensorforce' in fileContent) or ('stable_baselines' in fileContent) or ('keras' in fileContent) or ('tf' in fileContent):
-                        #         usageCount = usageCount + 1
-    return usageCount      
+                    with open(full_path_file, 'r', encoding='latin-1') as f:
+                        file_count, file_libs = countLibraryLines(f)
+                    usageCount = usageCount + file_count
+                    for x_ in ML_LIBRARY_KEYWORDS:
+                        lib_counts[x_] += file_libs[x_]
+    return ( path2dir, usageCount ) + tuple( lib_counts[x_] for x_ in ML_LIBRARY_KEYWORDS )
+
+def getMLLibraryUsage(path2dir): 
+    return getMLLibraryCensus(path2dir)[1]
 
 
 def deleteRepos():
@@ -137,9 +199,9 @@ if __name__=='__main__':
     deleteRepos()     
 
     di_ = '/Users/arahman/FSE2021_ML_REPOS/GITHUB_REPOS/'
-    ls_ = getMLStats(  di_  )
+    ls_ = getMLStats(  di_, workers=os.cpu_count()  )
     df_ = pd.DataFrame( ls_ )
-    df_.to_csv('LIB_BREAKDOWN_GITHUB_BATCH2.csv', header=['REPO', 'LIB_COUNT'] , index=False, encoding='utf-8')              
+    df_.to_csv('LIB_BREAKDOWN_GITHUB_BATCH2.csv', header=ML_CENSUS_HEADER , index=False, encoding='utf-8')              
     '''
 
 
@@ -2,22 +2,150 @@ import os
 import pandas as pd 
 import numpy as np
 import csv 
+import io 
 import time 
 from datetime import datetime
 import subprocess
 import shutil
-from git import Repo, exc 
+import collections 
+import itertools 
+import operator 
+import concurrent.futures 
+import argparse 
 import logging
+import logging.handlers 
+import queue 
+import atexit 
+import importlib.util 
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler()) ## nothing is logged, nor a file opened, until initLogging() 
 log_filename = f"mining_log_forensics.log"
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s | %(levelname)-8s | %(funcName)-20s | %(message)s',
-    handlers=[
-        logging.FileHandler(log_filename, encoding='utf-8'),
-        #logging.StreamHandler()  #also log to console
-    ]
-)
+log_format   = '%(asctime)s | %(levelname)-8s | %(funcName)-20s | %(message)s'
+LOG_BATCH_SIZE   = 1000 ## records per write with async logging 
+LOG_DEBUG_SAMPLE = 100  ## per item DEBUG records: the first and every n-th are logged, EXIT lines carry the totals 
+LOG_ENV_VAR      = 'MINING_FORENSICS_LOG'   ## a level name such as debug or info turns logging on at import 
+LOG_ASYNC_ENV_VAR= 'MINING_FORENSICS_ASYNC' ## 1 to log through startAsyncLogging() 
+LOG_STATE = { 'listener': None, 'level': None, 'log_file': None } ## level and file as initLogging() resolved them 
+
+class BatchFileHandler(logging.FileHandler):
+    '''
+    FileHandler that writes batch_size formatted records at once instead of one write and flush per record, 
+    WARNING and above are written straight away so a crash report is never left in the buffer 
+    '''
+    def __init__(self, filename, batch_size=LOG_BATCH_SIZE, encoding='utf-8'):
+        logging.FileHandler.__init__(self, filename, encoding=encoding)
+        self.batch_size = batch_size
+        self.pending_   = []
+
+    def emit(self, record):
+        try:
+            self.pending_.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+            return
+        if (len(self.pending_) >= self.batch_size) or (record.levelno >= logging.WARNING):
+            self.flush()
+
+    def flush(self):
+        self.acquire()
+        try:
+            if (self.stream is not None) and self.pending_:
+                self.stream.write(self.terminator.join(self.pending_) + self.terminator)
+                del self.pending_[:]
+            logging.FileHandler.flush(self)
+        finally:
+            self.release()
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    '''
+    QueueHandler.prepare() formats every record in the calling thread, the listener thread is left to do it here ... 
+    records never leave the process, so they need not be made picklable 
+    '''
+    def prepare(self, record):
+        return record
+
+def getFileHandler(log_file=log_filename):
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler.setFormatter(logging.Formatter(log_format))
+    return file_handler
+
+def setLogHandler(handler_):
+    '''
+    the forensic log belongs to this module's logger, the root logger and other libraries are left alone 
+    '''
+    for old_handler in list(logger.handlers):
+        logger.removeHandler(old_handler)
+        if not isinstance(old_handler, logging.handlers.QueueHandler):
+            old_handler.close()
+    logger.addHandler(handler_)
+    logger.propagate = False 
+
+def startAsyncLogging(log_file=log_filename, batch_size=LOG_BATCH_SIZE):
+    '''
+    callers then only put records on a queue, a QueueListener thread formats them and writes them in batches ... 
+    stopAsyncLogging(), also run at exit, drains the queue and goes back to the synchronous FileHandler. Does not 
+    set a level, see initLogging() 
+    '''
+    if LOG_STATE['listener'] is not None:
+        return LOG_STATE['listener']
+    batch_handler = BatchFileHandler(log_file, batch_size)
+    batch_handler.setFormatter(logging.Formatter(log_format))
+    log_queue = queue.SimpleQueue()
+    setLogHandler(DeferredQueueHandler(log_queue))
+    listener_ = logging.handlers.QueueListener(log_queue, batch_handler)
+    listener_.start()
+    LOG_STATE['listener'] = listener_
+    atexit.register(stopAsyncLogging)
+    return listener_
+
+def stopAsyncLogging(log_file=log_filename):
+    listener_ = LOG_STATE['listener']
+    if listener_ is None:
+        return 
+    LOG_STATE['listener'] = None
+    listener_.stop()
+    for handler_ in listener_.handlers:
+        handler_.close()
+    file_handler = getFileHandler(log_file)
+    setLogHandler(file_handler)
+    while not listener_.queue.empty(): ## logged by other threads between stop() and the swap 
+        record_ = listener_.queue.get_nowait()
+        if record_ is not None: ## the sentinel stop() put there
+            file_handler.handle(record_)
+
+def useSyncLogging(level=None, log_file=log_filename):
+    '''
+    pool worker initializer, given the level and file initLogging() resolved in the parent: a forked worker inherits 
+    the queue but not the listener thread, a spawned one re-imports this module with only the NullHandler ... either 
+    way the worker turns logging on itself and writes directly. Nothing is logged if the parent never logged 
+    '''
+    if level is None:
+        return 
+    LOG_STATE['listener'] = None
+    initLogging(level, log_file)
+
+def initLogging(level=logging.DEBUG, log_file=log_filename, async_logging=False):
+    '''
+    turns the forensic log on: level is a logging level or its name, records below it cost one isEnabledFor() check 
+    '''
+    if isinstance(level, str):
+        level = logging.getLevelName(level.strip().upper())
+        if not isinstance(level, int):
+            level = logging.DEBUG 
+    logger.setLevel(level)
+    LOG_STATE['level']    = level 
+    LOG_STATE['log_file'] = os.path.abspath(log_file) ## workers may not share the cwd it was relative to 
+    if async_logging:
+        startAsyncLogging(log_file)
+    elif LOG_STATE['listener'] is None:
+        setLogHandler(getFileHandler(log_file))
+
+if os.environ.get(LOG_ENV_VAR):
+    initLogging(os.environ[LOG_ENV_VAR], async_logging=os.environ.get(LOG_ASYNC_ENV_VAR) == '1')
+
+def isSampledDebug(item_no, sample_every=LOG_DEBUG_SAMPLE):
+    return (item_no == 1) or (item_no % sample_every == 0)
+
 def giveTimeStamp():
   tsObj = time.time()
   strToret = datetime.fromtimestamp(tsObj).strftime('%Y-%m-%d %H:%M:%S')
@@ -34,9 +162,10 @@ def deleteRepo(dirName, type_):
         
 # Method for fuzzing/logging     
 def dumpContentIntoFile(strP, fileP):
-    logger.info("=" * 80)
-    logger.info("dumpContentIntoFile ENTRY | content_type=%s content_len=%s | path_type=%s path=%s",
-                type(strP).__name__, len(str(strP)), type(fileP).__name__, repr(fileP)[:50])
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("=" * 80)
+        logger.info("dumpContentIntoFile ENTRY | content_type=%s content_len=%s | path_type=%s path=%s",
+                    type(strP).__name__, len(str(strP)), type(fileP).__name__, repr(fileP)[:50])
     
     try:
         fileToWrite = open(fileP, 'w')
@@ -52,71 +181,404 @@ def dumpContentIntoFile(strP, fileP):
         logger.info("=" * 80)
         raise
   
+def getCommittedSize(file_path):
+    '''
+    length of file_path as of its last ProgressWriter commit, never more than the file holds ... the file's own size 
+    if no writer ever committed it 
+    '''
+    file_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0 
+    try:
+        with open(file_path + '.committed', 'r') as offset_file:
+            return min(int(offset_file.read()), file_size)
+    except (OSError, ValueError):
+        return file_size 
+
+def getRowsSize(file_path, row_count):
+    '''
+    bytes taken by the first row_count lines of file_path, progress rows never hold a newline 
+    '''
+    rows_size = 0 
+    with open(file_path, 'rb') as file_:
+        for line_ in itertools.islice(file_, row_count):
+            rows_size += len(line_)
+    return rows_size 
+
+class ProgressWriter:
+    '''
+    append-only CSV progress file: rows are buffered and every batch_rows of them written, fsynced and committed by 
+    atomically replacing a side file that holds the committed length ... reopening with resume=True cuts the file 
+    back to that length, so a crash can lose the rows of the last batch but never leaves half a row behind. Opening 
+    commits straight away, so a fresh file never keeps the committed length of an earlier run 
+    '''
+    def __init__(self, file_path, header=None, batch_rows=100, resume=False, resume_rows=None):
+        self.file_path   = file_path
+        self.offset_path = file_path + '.committed'
+        self.batch_rows  = batch_rows
+        self.pending_    = 0 
+        self.buffer_     = io.StringIO()
+        self.writer_     = csv.writer(self.buffer_, lineterminator='\n')
+        committed_size   = getCommittedSize(file_path) if resume else 0 
+        if resume and (resume_rows is not None) and os.path.exists(file_path): ## rows past resume_rows were committed here but not in the tracker 
+            committed_size = min(committed_size, getRowsSize(file_path, resume_rows + (header is not None)))
+        self.file_       = open(file_path, 'ab')
+        self.file_.truncate(committed_size)
+        if (committed_size == 0) and (header is not None):
+            self.writer_.writerow(header)
+        self.commit()
+
+    def writeRow(self, row_):
+        self.writer_.writerow(row_)
+        self.pending_ += 1 
+        if self.pending_ >= self.batch_rows:
+            self.commit()
+
+    def commit(self):
+        '''
+        one write and one fsync for the whole batch, then the new length replaces the committed one in a single rename 
+        '''
+        self.file_.write(self.buffer_.getvalue().encode('utf-8'))
+        self.buffer_.seek(0)
+        self.buffer_.truncate()
+        self.file_.flush()
+        os.fsync(self.file_.fileno())
+        temp_path = self.offset_path + '.tmp'
+        with open(temp_path, 'w') as offset_file:
+            offset_file.write(str(os.fstat(self.file_.fileno()).st_size))
+            offset_file.flush()
+            os.fsync(offset_file.fileno())
+        os.replace(temp_path, self.offset_path)
+        self.pending_ = 0 
+
+    def close(self):
+        if not self.file_.closed:
+            self.commit()
+            self.file_.close()
+
+def getChunkSize(size_):
+    '''
+    chunk sizes are checked before any chunk is made: TypeError if size_ is not an integer, ValueError below 1 
+    '''
+    size_ = operator.index(size_)
+    if size_ < 1:
+        raise ValueError('chunk size must be at least 1, got ' + str(size_))
+    return size_
+
+def makeChunkRanges(item_count, size_):
+    '''
+    index ranges of the chunks of a sequence of item_count items, nothing of the sequence itself is copied 
+    '''
+    size_ = getChunkSize(size_)
+    return (range(i, min(i + size_, item_count)) for i in range(0, item_count, size_))
+
 # Method for fuzzing/logging
 def makeChunks(the_list, size_):
-    logger.info("=" * 80)
-    logger.info("makeChunks ENTRY | list_len=%s list_type=%s | size=%s size_type=%s", 
-                len(the_list), type(the_list).__name__, repr(size_), type(size_).__name__)
+    '''
+    lazy chunks of size_ items ... a NumPy array gives views, any other sequence one slice at a time, and an 
+    iterable without a length lists of size_ items pulled as they are needed. size_ is checked on the call, 
+    before the first chunk is asked for 
+    '''
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("=" * 80)
+        logger.info("makeChunks ENTRY | list_len=%s list_type=%s | size=%s size_type=%s", 
+                    len(the_list) if hasattr(the_list, '__len__') else None, type(the_list).__name__, 
+                    repr(size_), type(size_).__name__)
     
     try:
-        chunk_count = (len(the_list) + size_ - 1) // size_
-        logger.info("makeChunks: expected_chunks=%s", chunk_count)
-        
-        actual_chunks = 0
-        for i in range(0, len(the_list), size_):
-            chunk = the_list[i:i+size_]
+        size_ = getChunkSize(size_)
+    except Exception as e:
+        logger.error("makeChunks CRASHED | error_type=%s | error=%s", type(e).__name__, str(e))
+        logger.info("=" * 80)
+        raise
+    return iterChunks(the_list, size_)
+
+def iterChunks(the_list, size_):
+    try:
+        actual_chunks, items_yielded = 0, 0
+        debug_on = logger.isEnabledFor(logging.DEBUG) ## checked once, not per chunk 
+        if hasattr(the_list, '__len__') and hasattr(the_list, '__getitem__'):
+            logger.info("makeChunks: expected_chunks=%s", (len(the_list) + size_ - 1) // size_)
+            chunk_iter = (the_list[range_.start:range_.stop] for range_ in makeChunkRanges(len(the_list), size_))
+        else:
+            item_iter  = iter(the_list)
+            chunk_iter = iter(lambda: list(itertools.islice(item_iter, size_)), [])
+        for chunk in chunk_iter:
             actual_chunks += 1
-            logger.debug("makeChunks: chunk#%d | range=[%d:%s] | size=%d", actual_chunks, i, i+size_, len(chunk))
+            if debug_on and isSampledDebug(actual_chunks):
+                logger.debug("makeChunks: chunk#%d | range=[%d:%s] | size=%d", actual_chunks, items_yielded, 
+                             items_yielded + size_, len(chunk))
+            items_yielded += len(chunk)
             yield chunk
         
-        logger.info("makeChunks EXIT | chunks_yielded=%d", actual_chunks)
+        logger.info("makeChunks EXIT | chunks_yielded=%d | items_yielded=%d", actual_chunks, items_yielded)
         logger.info("=" * 80)
     except Exception as e:
         logger.error("makeChunks CRASHED | error_type=%s | error=%s", type(e).__name__, str(e))
         logger.info("=" * 80)
         raise
         
-def cloneRepo(repo_name, target_dir):
-    cmd_ = "git clone " + repo_name + " " + target_dir 
+def cloneRepo(repo_name, target_dir, screening=False):
+    '''
+    with screening the clone is partial: commits and trees but no file contents, then a sparse checkout of the 
+    files ending in py or ipynb, which is all that screening a repo reads 
+    '''
+    if screening:
+        cmd_list = [ ['git', 'clone', '--quiet', '--filter=blob:none', '--no-checkout', repo_name, target_dir], 
+                     ['git', '-C', target_dir, 'sparse-checkout', 'set', '--no-cone', '*py', '*ipynb'], 
+                     ['git', '-C', target_dir, 'checkout', '--quiet'] ]
+    else:
+        cmd_list = [ ['bash','-c', "git clone " + repo_name + " " + target_dir] ]
     try:
-       subprocess.check_output(['bash','-c', cmd_])    
+       for cmd_ in cmd_list:
+           subprocess.check_output(cmd_)    
     except subprocess.CalledProcessError:
        print('Skipping this repo ... trouble cloning repo:', repo_name )
 
+def completeRepo(dirName):
+    '''
+    turns a screening clone that was kept into a full checkout, missing file contents are fetched on demand 
+    '''
+    try:
+       subprocess.check_output(['git', '-C', dirName, 'sparse-checkout', 'disable'])    
+    except subprocess.CalledProcessError:
+       print('Trouble completing the checkout of repo:', dirName )
+
+def getTrackedFileCounts(dirName):
+    '''
+    ( all files, python files ) tracked at HEAD, read from the trees of a screening clone since its working 
+    tree only has the python files ... ( 0, 0 ) if there is no HEAD to list 
+    '''
+    try:
+        tree_names = subprocess.check_output(['git', '-C', dirName, 'ls-tree', '-r', '-z', '--name-only', 'HEAD'], 
+                                             stderr=subprocess.DEVNULL).decode('utf-8', errors='replace').split('\x00')
+    except subprocess.CalledProcessError:
+        return 0, 0 
+    file_list = [ os.path.basename(x_) for x_ in tree_names if x_ != '' ]
+    python_list = [ x_ for x_ in file_list if (x_.endswith('py')) or (x_.endswith('ipynb')) ]
+    return len(file_list), len(python_list) 
+
+ML_LIBRARY_PATTERNS = ['sklearn', 'h5py', 'gym', 'rl', 'tensorflow', 'keras', 'tf', 
+                       'stable_baselines', 'tensorforce', 'rl_coach', 'pyqlearning', 
+                       'MAMEToolkit', 'chainer', 'torch', 'chainerrl']
+
+def getKeywordMatcher(pattern_list):
+    '''
+    the patterns worth searching for in lowercased text, a pattern with capitals such as MAMEToolkit never matches 
+    '''
+    return tuple(x_ for x_ in pattern_list if x_ == x_.lower())
+
+KEYWORD_MATCHER = getKeywordMatcher(ML_LIBRARY_PATTERNS)
+SCAN_CHUNK_SIZE = 1024 * 1024 
+
+def countKeywordLines(content_, pattern_counts, matcher=KEYWORD_MATCHER):
+    '''
+    adds to pattern_counts the number of lines of content_ each pattern occurs in ... after a hit the search 
+    jumps to the next line, so a pattern counts once per line and lines without it cost one C level find 
+    '''
+    find_ = content_.find
+    for item_ in matcher:
+        line_count = 0 
+        match_pos  = find_(item_)
+        while match_pos != -1:
+            line_count += 1 
+            line_end = find_('\n', match_pos)
+            if line_end == -1:
+                break 
+            match_pos = find_(item_, line_end + 1)
+        pattern_counts[item_] += line_count 
+    return pattern_counts 
+
+def countKeywordLinesInFile(file_, pattern_counts, matcher=KEYWORD_MATCHER, chunk_size=SCAN_CHUNK_SIZE):
+    '''
+    same counts as countKeywordLines( file_.read().lower() ) but reads chunk_size characters at a time ... of the 
+    unfinished last line only the patterns already seen and a tail too short to hold a whole pattern are kept, so 
+    memory stays bounded even for a single huge line. Returns the number of characters scanned 
+    '''
+    return countKeywordLinesInChunks(iter(lambda: file_.read(chunk_size), ''), pattern_counts, matcher)
+
+def countKeywordLinesInChunks(chunk_iter, pattern_counts, matcher=KEYWORD_MATCHER):
+    '''
+    countKeywordLinesInFile() over any iterable of text chunks, e.g. the code cells of a notebook 
+    '''
+    tail_size  = max([len(x_) for x_ in matcher] + [1]) - 1 
+    tail_      = ''
+    line_hits  = set()
+    char_count = 0 
+    for chunk_ in chunk_iter:
+        char_count += len(chunk_)
+        text_   = tail_ + chunk_.lower()
+        last_nl = text_.rfind('\n')
+        if last_nl != -1:
+            first_nl  = text_.find('\n')
+            line_hits.update(x_ for x_ in matcher if x_ in text_[:first_nl])
+            for item_ in line_hits:
+                pattern_counts[item_] += 1 
+            countKeywordLines(text_[first_nl + 1:last_nl], pattern_counts, matcher)
+            line_hits = set()
+            text_     = text_[last_nl + 1:]
+        line_hits.update(x_ for x_ in matcher if x_ in text_)
+        tail_ = text_[-tail_size:] if tail_size > 0 else ''
+    for item_ in line_hits:
+        pattern_counts[item_] += 1 
+    return char_count 
+
+FAME_ML_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'FAME-ML'))
+NOTEBOOK_STATE = { 'reader': None }
+
+def loadNotebookReader():
+    '''
+    the streaming .ipynb reader is shared with FAME-ML and loaded from there on the first notebook scan ... under a 
+    name of its own and kept out of sys.modules, so it never stands in for a module these scripts import 
+    '''
+    if NOTEBOOK_STATE['reader'] is None:
+        reader_spec = importlib.util.spec_from_file_location('mining_notebook_reader', os.path.join(FAME_ML_DIR, 'notebook_reader.py'))
+        reader_module = importlib.util.module_from_spec(reader_spec)
+        reader_spec.loader.exec_module(reader_module)
+        NOTEBOOK_STATE['reader'] = reader_module 
+    return NOTEBOOK_STATE['reader']
+
+def iterNotebookCode(file_, chunk_size=SCAN_CHUNK_SIZE):
+    '''
+    code cells of a notebook, each ending in a newline so that two cells never share a line 
+    '''
+    for cell_source in loadNotebookReader().NotebookReader(file_, chunk_size).iterCodeCells():
+        yield cell_source + '\n'
+
+def countKeywordLinesInPath(full_path_file, pattern_counts, matcher=KEYWORD_MATCHER):
+    '''
+    adds the counts of one .py or .ipynb file, returns the bytes read ... a notebook is scanned through its code cells 
+    only, so outputs, markdown and base64 images give no hits, unless it does not load as a notebook at all 
+    '''
+    if full_path_file.endswith('ipynb'):
+        file_counts = dict.fromkeys(pattern_counts, 0)
+        try:
+            with open(full_path_file, 'r', encoding='utf-8') as f:
+                countKeywordLinesInChunks(iterNotebookCode(f), file_counts, matcher)
+                bytes_read = os.fstat(f.fileno()).st_size
+            for item_, count_ in file_counts.items():
+                pattern_counts[item_] += count_ 
+            return bytes_read 
+        except ValueError:
+            logger.debug("checkPythonFile: not a notebook, scanning raw text | %s", os.path.basename(full_path_file))
+    with open(full_path_file, 'r', encoding='latin-1') as f:
+        return countKeywordLinesInFile(f, pattern_counts, matcher)
+
+def walkRepoFiles(path2dir):
+    '''
+    one os.scandir traversal that sees the files os.walk sees, .git included and symlinked dirs not followed ... 
+    returns ( file count, paths of files ending in py or ipynb, bytes of those files ) 
+    '''
+    all_fil_cnt, python_bytes = 0, 0 
+    python_list = []
+    dir_stack   = [ os.fspath(path2dir) ]
+    while dir_stack:
+        try:
+            dir_iter = os.scandir(dir_stack.pop())
+        except OSError:
+            continue 
+        with dir_iter:
+            for entry_ in dir_iter:
+                try:
+                    is_dir = entry_.is_dir()
+                except OSError:
+                    is_dir = False 
+                if is_dir:
+                    if not entry_.is_symlink():
+                        dir_stack.append(entry_.path)
+                else:
+                    all_fil_cnt += 1 
+                    if (entry_.name.endswith('py')) or (entry_.name.endswith('ipynb')):
+                        python_list.append(entry_.path)
+                        try:
+                            python_bytes += entry_.stat().st_size
+                        except OSError:
+                            pass
+    return all_fil_cnt, python_list, python_bytes 
+
+def scanKeywordFiles(python_list, pattern_list=ML_LIBRARY_PATTERNS):
+    '''
+    returns ( lines per pattern, files scanned, bytes scanned ) for the given .py and .ipynb files 
+    '''
+    matcher = KEYWORD_MATCHER if pattern_list is ML_LIBRARY_PATTERNS else getKeywordMatcher(pattern_list)
+    pattern_counts = dict.fromkeys(pattern_list, 0)
+    files_processed, bytes_scanned = 0, 0 
+    debug_on = logger.isEnabledFor(logging.DEBUG)
+    for full_path_file in python_list:
+        if os.path.exists(full_path_file):
+            files_processed += 1
+            if debug_on and isSampledDebug(files_processed):
+                logger.debug("checkPythonFile: processing file#%d | %s", files_processed, os.path.basename(full_path_file))
+            
+            bytes_scanned += countKeywordLinesInPath(full_path_file, pattern_counts, matcher)
+    return pattern_counts, files_processed, bytes_scanned 
+
+def hasKeywordHit(python_list, matcher=KEYWORD_MATCHER, chunk_size=SCAN_CHUNK_SIZE):
+    '''
+    True at the first ML keyword in any of the files ... screening only needs to know if checkPattern is zero, and 
+    as no pattern holds a newline the tail carried across chunks cannot join two lines into a false hit 
+    '''
+    tail_size = max([len(x_) for x_ in matcher] + [1]) - 1 
+    for full_path_file in python_list:
+        if os.path.exists(full_path_file):
+            if full_path_file.endswith('ipynb'):
+                try:
+                    with open(full_path_file, 'r', encoding='utf-8') as f:
+                        for cell_source in iterNotebookCode(f, chunk_size):
+                            cell_source = cell_source.lower()
+                            if any(x_ in cell_source for x_ in matcher):
+                                return True 
+                    continue 
+                except ValueError:
+                    pass ## not a notebook, its raw text is checked as before 
+            with open(full_path_file, 'r', encoding='latin-1') as f:
+                tail_ = ''
+                for chunk_ in iter(lambda: f.read(chunk_size), ''):
+                    text_ = tail_ + chunk_.lower()
+                    if any(x_ in text_ for x_ in matcher):
+                        return True 
+                    tail_ = text_[-tail_size:] if tail_size > 0 else ''
+    return False 
+
+def scanKeywordUsage(path2dir, pattern_list=ML_LIBRARY_PATTERNS):
+    '''
+    returns ( lines per pattern, files scanned, bytes scanned ) for the .py and .ipynb files under path2dir 
+    '''
+    all_fil_cnt, python_list, python_bytes = walkRepoFiles(path2dir)
+    return scanKeywordFiles(python_list, pattern_list)
+
+def profileRepo(path2dir, python_threshold=0.10, scan_keywords=True):
+    '''
+    file count, python/notebook count and bytes from one traversal, plus keyword hits per library unless the repo 
+    already fails python_threshold or scan_keywords is off, in which case the files are never read 
+    '''
+    all_fil_cnt, python_list, python_bytes = walkRepoFiles(path2dir)
+    profile_ = { 'files': all_fil_cnt, 'python_files': len(python_list), 'python_paths': python_list, 
+                 'bytes': python_bytes, 'keyword_counts': None, 'keyword_hits': None }
+    if scan_keywords and (all_fil_cnt > 0) and (len(python_list) >= (all_fil_cnt * python_threshold)):
+        pattern_counts, files_processed, bytes_scanned = scanKeywordFiles(python_list)
+        profile_['keyword_counts'] = pattern_counts 
+        profile_['keyword_hits']   = sum(pattern_counts.values())
+    logger.info("profileRepo | files=%d python_files=%d bytes=%d keyword_hits=%s", 
+                all_fil_cnt, len(python_list), python_bytes, profile_['keyword_hits'])
+    return profile_ 
+
 # Method for fuzzing/logging
 def checkPythonFile(path2dir):
-    logger.info("=" * 80)
-    logger.info("checkPythonFile ENTRY | path_type=%s path=%s",
-                type(path2dir).__name__, repr(path2dir)[:50])
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("=" * 80)
+        logger.info("checkPythonFile ENTRY | path_type=%s path=%s",
+                    type(path2dir).__name__, repr(path2dir)[:50])
     
     try:
-        usageCount = 0
-        files_processed = 0
-        patternDict = ['sklearn', 'h5py', 'gym', 'rl', 'tensorflow', 'keras', 'tf', 
-                       'stable_baselines', 'tensorforce', 'rl_coach', 'pyqlearning', 
-                       'MAMEToolkit', 'chainer', 'torch', 'chainerrl']
-        
-        for root_, dirnames, filenames in os.walk(path2dir):
-            for file_ in filenames:
-                full_path_file = os.path.join(root_, file_)
-                
-                if os.path.exists(full_path_file):
-                    if (file_.endswith('py')) or (file_.endswith('ipynb')):
-                        files_processed += 1
-                        logger.debug("checkPythonFile: processing file#%d | %s", files_processed, file_)
-                        
-                        f = open(full_path_file, 'r', encoding='latin-1')
-                        pythonFileContent = f.read()
-                        pythonFileContent = pythonFileContent.split('\n')
-                        pythonFileContent = [z_.lower() for z_ in pythonFileContent if z_ != '\n']
-                        
-                        for content_ in pythonFileContent:
-                            for item_ in patternDict:
-                                if item_ in content_:
-                                    usageCount += 1
-                                    logger.debug("checkPythonFile: match#%d | pattern=%s", usageCount, item_)
+        start_time = time.perf_counter()
+        pattern_counts, files_processed, bytes_scanned = scanKeywordUsage(path2dir)
+        scan_time = time.perf_counter() - start_time
+        usageCount = sum(pattern_counts.values())
         
         logger.info("checkPythonFile EXIT | files_processed=%d | total_matches=%d", files_processed, usageCount)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("checkPythonFile: matched_libraries=%s | bytes=%d | mb_per_sec=%.2f", 
+                        {k_: v_ for k_, v_ in pattern_counts.items() if v_ > 0}, bytes_scanned, 
+                        bytes_scanned / 1048576.0 / scan_time if scan_time > 0 else 0.0)
         logger.info("=" * 80)
         return usageCount
     except Exception as e:
@@ -128,9 +590,10 @@ def checkPythonFile(path2dir):
 def days_between(d1_, d2_): ## pass in date time objects, if string see commented code 
     # d1_ = datetime.strptime(d1_, "%Y-%m-%d")
     # d2_ = datetime.strptime(d2_, "%Y-%m-%d")
-    logger.info("=" * 80)
-    logger.info("days_between ENTRY | d1_type=%s d1=%s | d2_type=%s d2=%s",
-                type(d1_).__name__, str(d1_), type(d2_).__name__, str(d2_))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("=" * 80)
+        logger.info("days_between ENTRY | d1_type=%s d1=%s | d2_type=%s d2=%s",
+                    type(d1_).__name__, str(d1_), type(d2_).__name__, str(d2_))
     
     try:
         days_between = abs((d2_ - d1_).days)
@@ -143,51 +606,45 @@ def days_between(d1_, d2_): ## pass in date time objects, if string see commente
         logger.info("=" * 80)
         raise
     
-def getDevEmailForCommit(repo_path_param, hash_):
-    author_emails = []
-
-    cdCommand         = "cd " + repo_path_param + " ; "
-    commitCountCmd    = " git log --format='%ae'" + hash_ + "^!"
-    command2Run = cdCommand + commitCountCmd
-
-    author_emails = str(subprocess.check_output(['bash','-c', command2Run]))
-    author_emails = author_emails.split('\n')
-    # print(type(author_emails)) 
-    author_emails = [x_.replace(hash_, '') for x_ in author_emails if x_ != '\n' and '@' in x_ ] 
-    author_emails = [x_.replace('^', '') for x_ in author_emails if x_ != '\n' and '@' in x_ ] 
-    author_emails = [x_.replace('!', '') for x_ in author_emails if x_ != '\n' and '@' in x_ ] 
-    author_emails = [x_.replace('\\n', ',') for x_ in author_emails if x_ != '\n' and '@' in x_ ] 
+def getCommitEmailsAndDays(repo_path_param, branchName='master'):
+    '''
+    yields ( hash, author email, commit day ) for every commit of branchName, read from one streaming git log 
+    instead of one git process per commit ... raises CalledProcessError if git log fails, e.g. for a missing branch 
+    '''
+    log_proc = subprocess.Popen(['git', 'log', '--format=%H%x00%ae%x00%cI', branchName], cwd=repo_path_param, 
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
     try:
-        author_emails = author_emails[0].split(',')
-        author_emails = [x_ for x_ in author_emails if len(x_) > 3 ] 
-        # print(author_emails) 
-        author_emails = list(np.unique(author_emails) )
-    except IndexError as e_:
-        pass
-    return author_emails  
+        for log_line in log_proc.stdout:
+            hash_, email_, date_ = log_line.decode('utf-8', errors='replace').rstrip('\n').split('\x00')
+            yield hash_, email_, date_[:10] ## ISO date of the committer, same day as committed_datetime 
+    finally:
+        log_proc.stdout.close()
+        return_code = log_proc.wait()
+    if return_code != 0:
+        raise subprocess.CalledProcessError(return_code, log_proc.args)
     
-def getDevDayCount(full_path_to_repo, branchName='master', explore=1000):
-    repo_emails = []
-    all_commits = []
-    repo_emails = []
+def getDevDayCount(full_path_to_repo, branchName='master', explore=1000, dev_stop=None, commit_stop=None):
+    '''
+    with dev_stop / commit_stop the history is read only until that many distinct emails / commits were seen, the 
+    counts and the age are then lower bounds of the real ones 
+    '''
+    repo_emails = set()
+    commit_count = 0 
     all_time_list = []
     if os.path.exists(full_path_to_repo):
-        repo_  = Repo(full_path_to_repo)
         try:
-           all_commits = list(repo_.iter_commits(branchName))   
-        except exc.GitCommandError:
-           print('Skipping this repo ... due to branch name problem', full_path_to_repo )
-        # only check commit by commit if less than explore threshold
-
-        for commit_ in all_commits:
-            commit_hash = commit_.hexsha
-
-            emails = getDevEmailForCommit(full_path_to_repo, commit_hash)
-            repo_emails = repo_emails + emails
-            
-            timestamp_commit = commit_.committed_datetime
-            str_time_commit  = timestamp_commit.strftime('%Y-%m-%d') ## date with time 
-            all_time_list.append( str_time_commit )
+            for commit_hash, author_email, str_time_commit in getCommitEmailsAndDays(full_path_to_repo, branchName):
+                commit_count += 1 
+                if ('@' in author_email) and (len(author_email) > 3):
+                    repo_emails.add(author_email)
+                all_time_list.append( str_time_commit )
+                if ( (dev_stop is not None) or (commit_stop is not None) ) and \
+                   ( (dev_stop is None) or (len(repo_emails) >= dev_stop) ) and \
+                   ( (commit_stop is None) or (commit_count >= commit_stop) ):
+                    break 
+        except subprocess.CalledProcessError:
+            print('Skipping this repo ... due to branch name problem', full_path_to_repo )
+            repo_emails, commit_count, all_time_list = set(), 0, []
 
     all_day_list   = [datetime(int(x_.split('-')[0]), int(x_.split('-')[1]), int(x_.split('-')[2]), 12, 30) for x_ in all_time_list]
     try:
@@ -198,23 +655,28 @@ def getDevDayCount(full_path_to_repo, branchName='master', explore=1000):
         ds_life_days   = 0
     ds_life_months = round(float(ds_life_days)/float(30), 5)
     
-    return len(repo_emails) , len(all_commits) , ds_life_days, ds_life_months 
+    return len(repo_emails) , commit_count , ds_life_days, ds_life_months 
             
 # Method for fuzzing/logging
 def getPythonFileCount(path2dir):
-    logger.info("=" * 80)
-    logger.info("getPythonFileCount ENTRY | path_type=%s path=%s",
-                type(path2dir).__name__, repr(path2dir)[:50])
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("=" * 80)
+        logger.info("getPythonFileCount ENTRY | path_type=%s path=%s",
+                    type(path2dir).__name__, repr(path2dir)[:50])
     
     try:
         valid_list = []
+        notebook_count = 0 
+        debug_on = logger.isEnabledFor(logging.DEBUG)
         for root_, dirnames, filenames in os.walk(path2dir):
             for file_ in filenames:
                 if (file_.endswith('py')) or (file_.endswith('ipynb')):
                     valid_list.append(file_)
-                    logger.debug("getPythonFileCount: found file#%d | %s", len(valid_list), file_)
+                    notebook_count += file_.endswith('ipynb')
+                    if debug_on and isSampledDebug(len(valid_list)):
+                        logger.debug("getPythonFileCount: found file#%d | %s", len(valid_list), file_)
         
-        logger.info("getPythonFileCount EXIT | python_files=%d", len(valid_list))
+        logger.info("getPythonFileCount EXIT | python_files=%d | notebooks=%d", len(valid_list), notebook_count)
         logger.info("=" * 80)
         return len(valid_list)
     except Exception as e:
@@ -224,62 +686,196 @@ def getPythonFileCount(path2dir):
     
     
 
-def cloneRepos(repo_list, dev_threshold=3, python_threshold=0.10, commit_threshold = 25): 
-    counter = 0     
-    str_ = ''
-    all_list = []
+def getTrackedRepos(tracker_file):
+    '''
+    repos of the rows of a tracker_completed_repos.csv in file order, these are skipped on resume 
+    '''
+    if not os.path.exists(tracker_file):
+        return []
+    with open(tracker_file, 'r', newline='', encoding='utf-8') as file_:
+        return [ row_[1] for row_ in csv.reader(file_) ]
+
+def getRepoDirName(repo_, clone_root='../FSE2021_REPOS/'):
+    return clone_root + repo_.split('/')[-2] + '@' + repo_.split('/')[-1] ## '/' at the end messes up the index 
+
+def getDirSize(dirName):
+    dir_size = 0 
+    for root_, dirnames, filenames in os.walk(dirName):
+        for file_ in filenames:
+            try:
+                dir_size += os.lstat(os.path.join(root_, file_)).st_size
+            except OSError:
+                pass
+    return dir_size 
+
+def screenRepo(dirName, dev_threshold=3, python_threshold=0.10, commit_threshold=25, screening=False, early_exit=False):
+    '''
+    measures a cloned repo and deletes it if it does not qualify, returns 
+    ( checkPattern, dev_count, all_fil_cnt, python_count, commit_count, age_months, flag ) 
+    a screening clone counts the files tracked at HEAD, the full walk also counts what is under .git 
+    with early_exit each filter stops once its threshold is met: devs, commits and age are then lower bounds and 
+    checkPattern is 1 for any keyword hit 
+    '''
+    ### get all count, the keyword scan later reads the python files this single traversal found 
+    checkPattern, dev_count, python_count, commit_count, age_months   = 0 , 0, 0, 0, 0 
+    flag = True
+    profile_ = profileRepo(dirName, python_threshold, scan_keywords=False)
+    all_fil_cnt, python_count = profile_['files'], profile_['python_files']
+    if screening and os.path.exists(dirName):
+        all_fil_cnt, python_count = getTrackedFileCounts(dirName) 
+    if (all_fil_cnt <= 0):
+        deleteRepo(dirName, 'NO_FILES')
+        flag = False
+    elif (python_count < (all_fil_cnt * python_threshold) ):
+        deleteRepo(dirName, 'NOT_ENOUGH_PYTHON_FILES')
+        flag = False
+    else:       
+        if early_exit:
+            dev_count, commit_count, age_days, age_months  = getDevDayCount(dirName, dev_stop=dev_threshold, commit_stop=commit_threshold)
+        else:
+            dev_count, commit_count, age_days, age_months  = getDevDayCount(dirName)
+        if (dev_count < dev_threshold):                
+            deleteRepo(dirName, 'LIMITED_DEVS') 
+            flag = False  
+        elif (commit_count < commit_threshold):                
+            deleteRepo(dirName, 'LIMITED_COMMITS')  
+            flag = False
+    if (flag == True ): 
+        if early_exit:
+            checkPattern = int(hasKeywordHit(profile_['python_paths']))
+        else:
+            checkPattern = sum(scanKeywordFiles(profile_['python_paths'])[0].values()) 
+        if (checkPattern == 0 ):
+            deleteRepo(dirName, 'NO_PATTERN')
+            flag = False        
+        elif screening:
+            completeRepo(dirName)
+    return checkPattern, dev_count, all_fil_cnt, python_count, commit_count, age_months, flag 
+
+def screenReposSerially(repo_list, dev_threshold=3, python_threshold=0.10, commit_threshold=25, clone_root='../FSE2021_REPOS/', 
+                        screening=False, early_exit=False, skip_repos=frozenset()):
+    '''
+    clones and screens one repo at a time, yields ( counter, repo_, dirName, screen result ) ... repos in skip_repos 
+    are passed over but keep their counter 
+    '''
+    counter = 0 
     for repo_batch in repo_list:
         for repo_ in repo_batch:
             counter += 1 
+            if repo_ in skip_repos:
+                continue 
             print('Cloning ', repo_ )
-            dirName = '../FSE2021_REPOS/' + repo_.split('/')[-2] + '@' + repo_.split('/')[-1] ## '/' at the end messes up the index 
-            cloneRepo(repo_, dirName )
-            ### get all count 
-            checkPattern, dev_count, python_count, commit_count, age_months   = 0 , 0, 0, 0, 0 
-            flag = True
-            all_fil_cnt = sum([len(files) for r_, d_, files in os.walk(dirName)])
-            python_count = getPythonFileCount(dirName) 
-            if (all_fil_cnt <= 0):
-                deleteRepo(dirName, 'NO_FILES')
-                flag = False
-            elif (python_count < (all_fil_cnt * python_threshold) ):
-                deleteRepo(dirName, 'NOT_ENOUGH_PYTHON_FILES')
-                flag = False
-            else:       
-                dev_count, commit_count, age_days, age_months  = getDevDayCount(dirName)
-                if (dev_count < dev_threshold):                
-                    deleteRepo(dirName, 'LIMITED_DEVS') 
-                    flag = False  
-                elif (commit_count < commit_threshold):                
-                    deleteRepo(dirName, 'LIMITED_COMMITS')  
-                    flag = False
-            if (flag == True ): 
-                checkPattern = checkPythonFile(dirName) 
-                if (checkPattern == 0 ):
-                    deleteRepo(dirName, 'NO_PATTERN')
-                    flag = False        
+            dirName = getRepoDirName(repo_, clone_root)
+            cloneRepo(repo_, dirName, screening )
+            yield counter, repo_, dirName, screenRepo(dirName, dev_threshold, python_threshold, commit_threshold, screening, early_exit)
+        print('*'*10)
+
+def cloneAndMeasure(counter, repo_, dirName, screening=False):
+    print('Cloning ', repo_ )
+    cloneRepo(repo_, dirName, screening )
+    return counter, repo_, dirName, getDirSize(dirName)
+
+def screenReposPipelined(repo_list, dev_threshold=3, python_threshold=0.10, commit_threshold=25, clone_root='../FSE2021_REPOS/', 
+                         clone_workers=4, analysis_workers=2, max_disk_bytes=5 * 1024 ** 3, screening=False, early_exit=False, 
+                         skip_repos=frozenset()):
+    '''
+    clone threads feed a pool of screening processes, so network bound clones and CPU bound scans overlap ... 
+    no new clone starts while the repos cloned but not yet screened take max_disk_bytes or more, unless nothing 
+    is in flight. Yields the same tuples as screenReposSerially(), in the order repos finish 
+    '''
+    repo_iter    = ( (counter, repo_) for counter, repo_ in enumerate( (repo_ for repo_batch in repo_list for repo_ in repo_batch), 1 ) 
+                     if repo_ not in skip_repos ) ## pulled one repo at a time 
+    next_repo    = next(repo_iter, None)
+    clone_jobs   = set()
+    screen_jobs  = {}
+    pending_disk = 0 
+    with concurrent.futures.ThreadPoolExecutor(max_workers=clone_workers) as clone_pool, \
+         concurrent.futures.ProcessPoolExecutor(max_workers=analysis_workers, initializer=useSyncLogging, 
+                                               initargs=(LOG_STATE['level'], LOG_STATE['log_file'])) as screen_pool:
+        while (next_repo is not None) or clone_jobs or screen_jobs:
+            while (next_repo is not None) and (len(clone_jobs) < clone_workers) and \
+                  ( (pending_disk < max_disk_bytes) or ( (not clone_jobs) and (not screen_jobs) ) ):
+                counter, repo_ = next_repo 
+                clone_jobs.add( clone_pool.submit(cloneAndMeasure, counter, repo_, getRepoDirName(repo_, clone_root), screening) )
+                next_repo = next(repo_iter, None)
+            done_jobs, _ = concurrent.futures.wait( clone_jobs | set(screen_jobs), return_when=concurrent.futures.FIRST_COMPLETED )
+            for job_ in done_jobs:
+                if job_ in clone_jobs:
+                    clone_jobs.remove(job_)
+                    counter, repo_, dirName, dir_size = job_.result()
+                    pending_disk += dir_size 
+                    screen_job = screen_pool.submit(screenRepo, dirName, dev_threshold, python_threshold, commit_threshold, screening, early_exit)
+                    screen_jobs[screen_job] = ( counter, repo_, dirName, dir_size )
+                else:
+                    counter, repo_, dirName, dir_size = screen_jobs.pop(job_)
+                    pending_disk -= dir_size 
+                    yield counter, repo_, dirName, job_.result()
+
+def cloneRepos(repo_list, dev_threshold=3, python_threshold=0.10, commit_threshold = 25, clone_root='../FSE2021_REPOS/', 
+               clone_workers=1, analysis_workers=1, max_disk_bytes=5 * 1024 ** 3, screening=False, early_exit=False, 
+               tracker_file='tracker_completed_repos.csv', breakdown_file='PYTHON_BREAKDOWN.csv', progress_rows=100, resume=False): 
+    '''
+    both progress files are appended to and committed every progress_rows repos, and once more at the end ... with 
+    resume=True they are cut back to their last commit and the repos already in the tracker are skipped, the 
+    returned list then only holds the repos of this run. The breakdown commits before the tracker, so it is never 
+    behind it and is cut back to the tracked rows 
+    '''
+    tracker_writer   = ProgressWriter(tracker_file, batch_rows=progress_rows, resume=resume)
+    tracked_repos    = getTrackedRepos(tracker_file) if resume else []
+    breakdown_writer = ProgressWriter(breakdown_file, ['INDEX', 'REPO', 'DEVS', 'FILES', 'PYTHON_FILES', 'COMMITS', 'AGE_MONTHS', 'FLAG'], 
+                                      batch_rows=progress_rows, resume=resume, resume_rows=len(tracked_repos))
+    skip_repos = frozenset(tracked_repos)
+    if (clone_workers <= 1) and (analysis_workers <= 1):
+        screened_repos = screenReposSerially(repo_list, dev_threshold, python_threshold, commit_threshold, clone_root, screening, early_exit, 
+                                             skip_repos)
+    else:
+        screened_repos = screenReposPipelined(repo_list, dev_threshold, python_threshold, commit_threshold, clone_root, 
+                                              clone_workers, analysis_workers, max_disk_bytes, screening, early_exit, skip_repos)
+    processed = 0 
+    recent_rows = []
+    all_list = []
+    try:
+        for counter, repo_, dirName, screen_tup in screened_repos:
+            processed += 1 
+            checkPattern, dev_count, all_fil_cnt, python_count, commit_count, age_months, flag = screen_tup 
             print('#'*100 )
-            str_ = str_ + str(counter) + ',' +  repo_ + ',' + dirName + ','  + str(checkPattern) + ',' + str(dev_count) + ',' + str(flag) + ',' + '\n'
             tup = ( counter,  dirName, dev_count, all_fil_cnt, python_count , commit_count, age_months, flag)
             all_list.append( tup ) 
-            print("So far we have processed {} repos".format(counter) )
-            if((counter % 100) == 0):
-                dumpContentIntoFile(str_, 'tracker_completed_repos.csv')
-                df_ = pd.DataFrame( all_list ) 
-                df_.to_csv('PYTHON_BREAKDOWN.csv', header=['INDEX', 'REPO', 'DEVS', 'FILES', 'PYTHON_FILES', 'COMMITS', 'AGE_MONTHS', 'FLAG'] , index=False, encoding='utf-8')    
-
-            if((counter % 1000) == 0):
-                print(str_)                
+            breakdown_writer.writeRow( tup[:6] + ( float(age_months), ) + tup[7:] ) ## written as 0.0 like the float column pandas wrote 
+            tracker_row = ( counter, repo_, dirName, checkPattern, dev_count, flag, '' )
+            tracker_writer.writeRow( tracker_row )
+            recent_rows.append( tracker_row )
+            print("So far we have processed {} repos".format(processed) )
+
+            if((processed % 1000) == 0):
+                print(''.join( ','.join( str(x_) for x_ in row_ ) + '\n' for row_ in recent_rows ))
+                recent_rows = []
             print('#'*100)
-        print('*'*10)
+    finally:
+        breakdown_writer.close()
+        tracker_writer.close()
+    return all_list 
         
    
 
 if __name__=='__main__':
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument('--clone-workers', type=int, default=1, help='parallel git clones, 1 with --analysis-workers 1 runs serially')
+    arg_parser.add_argument('--analysis-workers', type=int, default=1, help='processes screening cloned repos')
+    arg_parser.add_argument('--max-disk-gb', type=float, default=5, help='stop starting clones while unscreened repos use this much disk')
+    arg_parser.add_argument('--screening', action='store_true', help='partial clones with only the python files checked out, kept repos are completed')
+    arg_parser.add_argument('--early-exit', action='store_true', help='stop each filter once its threshold is met, counts become lower bounds')
+    arg_parser.add_argument('--resume', action='store_true', help='keep the committed progress files and skip the repos they already track')
+    arg_parser.add_argument('--log-level', default='debug', help='level of the forensic log, off to disable it')
+    arg_parser.add_argument('--async-logging', action='store_true', help='write the forensic log from a background thread in batches')
+    cli_args = arg_parser.parse_args()
+    if cli_args.log_level.lower() != 'off':
+        initLogging(cli_args.log_level, async_logging=cli_args.async_logging)
+
     repos_df = pd.read_csv('PARTIAL_REMAINING_GITHUB.csv', sep='delimiter')
     print(repos_df.head())
-    list_    = repos_df['url'].tolist()
-    list_ = np.unique(list_)
+    list_ = np.unique(repos_df['url'].to_numpy(dtype=str)) ## one sorted array of unique URLs, chunked below as views 
+    del repos_df 
     
     t1 = time.time()
     print('Started at:', giveTimeStamp() )
@@ -288,8 +884,10 @@ if __name__=='__main__':
     
     print('Repos to download:', len(list_)) 
     ## need to create chunks as too many repos 
-    chunked_list = list(makeChunks(list_, 100))  ### list of lists, at each batch download 1000 repos 
-    cloneRepos(chunked_list)
+    chunked_list = makeChunks(list_, 100)  ### lazy batches of 100 repos 
+    cloneRepos(chunked_list, clone_workers=cli_args.clone_workers, analysis_workers=cli_args.analysis_workers, 
+               max_disk_bytes=int(cli_args.max_disk_gb * 1024 ** 3), screening=cli_args.screening, 
+               early_exit=cli_args.early_exit, resume=cli_args.resume)
 
 
     print('*'*100 )
@@ -31,6 +31,8 @@ mining = SourceFileLoader(
         "mining.py",
     ),
 ).load_module()
+# importing mining no longer configures logging, keep writing its forensic log
+mining.initLogging()
 
 
 @contextmanager